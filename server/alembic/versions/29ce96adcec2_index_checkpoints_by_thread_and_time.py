@@ -0,0 +1,38 @@
+"""index_checkpoints_by_thread_and_time
+
+Revision ID: 29ce96adcec2
+Revises: 4f528ed99787
+Create Date: 2026-10-15 09:40:07.518326
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '29ce96adcec2'
+down_revision: Union[str, Sequence[str], None] = '4f528ed99787'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the thread_id index with a (thread_id, created_at DESC) index."""
+    # Latest-checkpoint lookups become a single index descent
+    op.create_index(
+        'ix_agent_checkpoints_thread_created',
+        'agent_checkpoints',
+        ['thread_id', sa.text('created_at DESC')],
+        unique=False,
+    )
+    
+    # The composite index covers thread_id-only lookups as well
+    op.drop_index('ix_agent_checkpoints_thread_id', table_name='agent_checkpoints')
+
+
+def downgrade() -> None:
+    """Restore the single-column thread_id index."""
+    op.create_index('ix_agent_checkpoints_thread_id', 'agent_checkpoints', ['thread_id'], unique=False)
+    op.drop_index('ix_agent_checkpoints_thread_created', table_name='agent_checkpoints')
@@ -18,65 +18,64 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _execute_batch(statements: str) -> None:
+    """Run several DDL statements in one round-trip.
+    
+    asyncpg sends every statement through the extended query protocol,
+    which rejects multi-command strings, so the batch is wrapped in a
+    single anonymous DO block instead.
+    """
+    op.execute(f"DO $batch$ BEGIN {statements} END $batch$")
+
+
 def upgrade() -> None:
     """Enable RLS and create policies for all tables."""
     
     # Enable RLS on all tables
-    op.execute("ALTER TABLE users ENABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE projects ENABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE files ENABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE code_chunks ENABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE code_embeddings ENABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE conversations ENABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE messages ENABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE agent_checkpoints ENABLE ROW LEVEL SECURITY")
+    _execute_batch('''
+        ALTER TABLE users ENABLE ROW LEVEL SECURITY;
+        ALTER TABLE projects ENABLE ROW LEVEL SECURITY;
+        ALTER TABLE files ENABLE ROW LEVEL SECURITY;
+        ALTER TABLE code_chunks ENABLE ROW LEVEL SECURITY;
+        ALTER TABLE code_embeddings ENABLE ROW LEVEL SECURITY;
+        ALTER TABLE conversations ENABLE ROW LEVEL SECURITY;
+        ALTER TABLE messages ENABLE ROW LEVEL SECURITY;
+        ALTER TABLE agent_checkpoints ENABLE ROW LEVEL SECURITY;
+    ''')
     
-    # Users table policies
-    op.execute('''
+    # Create all policies in a single round-trip
+    _execute_batch('''
+        -- Users table policies
         CREATE POLICY "Users can view own profile"
         ON users FOR SELECT
-        USING (auth.uid()::uuid = id)
-    ''')
-    
-    op.execute('''
+        USING (auth.uid()::uuid = id);
+
         CREATE POLICY "Users can update own profile"
         ON users FOR UPDATE
-        USING (auth.uid()::uuid = id)
-    ''')
-    
-    op.execute('''
+        USING (auth.uid()::uuid = id);
+
         CREATE POLICY "Allow user registration"
         ON users FOR INSERT
-        WITH CHECK (true)
-    ''')
-    
-    # Projects table policies
-    op.execute('''
+        WITH CHECK (true);
+
+        -- Projects table policies
         CREATE POLICY "Users can view own projects"
         ON projects FOR SELECT
-        USING (auth.uid()::uuid = user_id)
-    ''')
-    
-    op.execute('''
+        USING (auth.uid()::uuid = user_id);
+
         CREATE POLICY "Users can create own projects"
         ON projects FOR INSERT
-        WITH CHECK (auth.uid()::uuid = user_id)
-    ''')
-    
-    op.execute('''
+        WITH CHECK (auth.uid()::uuid = user_id);
+
         CREATE POLICY "Users can update own projects"
         ON projects FOR UPDATE
-        USING (auth.uid()::uuid = user_id)
-    ''')
-    
-    op.execute('''
+        USING (auth.uid()::uuid = user_id);
+
         CREATE POLICY "Users can delete own projects"
         ON projects FOR DELETE
-        USING (auth.uid()::uuid = user_id)
-    ''')
-    
-    # Files table policies
-    op.execute('''
+        USING (auth.uid()::uuid = user_id);
+
+        -- Files table policies
         CREATE POLICY "Users can view own project files"
         ON files FOR SELECT
         USING (
@@ -85,10 +84,8 @@ def upgrade() -> None:
                 WHERE projects.id = files.project_id
                 AND projects.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    op.execute('''
+        );
+
         CREATE POLICY "Users can create files in own projects"
         ON files FOR INSERT
         WITH CHECK (
@@ -97,10 +94,8 @@ def upgrade() -> None:
                 WHERE projects.id = files.project_id
                 AND projects.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    op.execute('''
+        );
+
         CREATE POLICY "Users can update own project files"
         ON files FOR UPDATE
         USING (
@@ -109,10 +104,8 @@ def upgrade() -> None:
                 WHERE projects.id = files.project_id
                 AND projects.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    op.execute('''
+        );
+
         CREATE POLICY "Users can delete own project files"
         ON files FOR DELETE
         USING (
@@ -121,11 +114,9 @@ def upgrade() -> None:
                 WHERE projects.id = files.project_id
                 AND projects.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    # Code chunks table policies
-    op.execute('''
+        );
+
+        -- Code chunks table policies
         CREATE POLICY "Users can view own project code chunks"
         ON code_chunks FOR SELECT
         USING (
@@ -134,10 +125,8 @@ def upgrade() -> None:
                 WHERE projects.id = code_chunks.project_id
                 AND projects.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    op.execute('''
+        );
+
         CREATE POLICY "Users can create code chunks in own projects"
         ON code_chunks FOR INSERT
         WITH CHECK (
@@ -146,10 +135,8 @@ def upgrade() -> None:
                 WHERE projects.id = code_chunks.project_id
                 AND projects.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    op.execute('''
+        );
+
         CREATE POLICY "Users can update own project code chunks"
         ON code_chunks FOR UPDATE
         USING (
@@ -158,10 +145,8 @@ def upgrade() -> None:
                 WHERE projects.id = code_chunks.project_id
                 AND projects.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    op.execute('''
+        );
+
         CREATE POLICY "Users can delete own project code chunks"
         ON code_chunks FOR DELETE
         USING (
@@ -170,11 +155,9 @@ def upgrade() -> None:
                 WHERE projects.id = code_chunks.project_id
                 AND projects.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    # Code embeddings table policies
-    op.execute('''
+        );
+
+        -- Code embeddings table policies
         CREATE POLICY "Users can view own project embeddings"
         ON code_embeddings FOR SELECT
         USING (
@@ -183,10 +166,8 @@ def upgrade() -> None:
                 WHERE projects.id = code_embeddings.project_id
                 AND projects.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    op.execute('''
+        );
+
         CREATE POLICY "Users can create embeddings in own projects"
         ON code_embeddings FOR INSERT
         WITH CHECK (
@@ -195,10 +176,8 @@ def upgrade() -> None:
                 WHERE projects.id = code_embeddings.project_id
                 AND projects.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    op.execute('''
+        );
+
         CREATE POLICY "Users can delete own project embeddings"
         ON code_embeddings FOR DELETE
         USING (
@@ -207,36 +186,26 @@ def upgrade() -> None:
                 WHERE projects.id = code_embeddings.project_id
                 AND projects.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    # Conversations table policies
-    op.execute('''
+        );
+
+        -- Conversations table policies
         CREATE POLICY "Users can view own conversations"
         ON conversations FOR SELECT
-        USING (auth.uid()::uuid = user_id)
-    ''')
-    
-    op.execute('''
+        USING (auth.uid()::uuid = user_id);
+
         CREATE POLICY "Users can create own conversations"
         ON conversations FOR INSERT
-        WITH CHECK (auth.uid()::uuid = user_id)
-    ''')
-    
-    op.execute('''
+        WITH CHECK (auth.uid()::uuid = user_id);
+
         CREATE POLICY "Users can update own conversations"
         ON conversations FOR UPDATE
-        USING (auth.uid()::uuid = user_id)
-    ''')
-    
-    op.execute('''
+        USING (auth.uid()::uuid = user_id);
+
         CREATE POLICY "Users can delete own conversations"
         ON conversations FOR DELETE
-        USING (auth.uid()::uuid = user_id)
-    ''')
-    
-    # Messages table policies
-    op.execute('''
+        USING (auth.uid()::uuid = user_id);
+
+        -- Messages table policies
         CREATE POLICY "Users can view own conversation messages"
         ON messages FOR SELECT
         USING (
@@ -245,10 +214,8 @@ def upgrade() -> None:
                 WHERE conversations.id = messages.conversation_id
                 AND conversations.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    op.execute('''
+        );
+
         CREATE POLICY "Users can create messages in own conversations"
         ON messages FOR INSERT
         WITH CHECK (
@@ -257,10 +224,8 @@ def upgrade() -> None:
                 WHERE conversations.id = messages.conversation_id
                 AND conversations.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    op.execute('''
+        );
+
         CREATE POLICY "Users can update own conversation messages"
         ON messages FOR UPDATE
         USING (
@@ -269,10 +234,8 @@ def upgrade() -> None:
                 WHERE conversations.id = messages.conversation_id
                 AND conversations.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    op.execute('''
+        );
+
         CREATE POLICY "Users can delete own conversation messages"
         ON messages FOR DELETE
         USING (
@@ -281,26 +244,20 @@ def upgrade() -> None:
                 WHERE conversations.id = messages.conversation_id
                 AND conversations.user_id = auth.uid()::uuid
             )
-        )
-    ''')
-    
-    # Agent checkpoints table policies
-    op.execute('''
+        );
+
+        -- Agent checkpoints table policies
         CREATE POLICY "Users can view agent checkpoints"
         ON agent_checkpoints FOR SELECT
-        USING (auth.uid() IS NOT NULL)
-    ''')
-    
-    op.execute('''
+        USING (auth.uid() IS NOT NULL);
+
         CREATE POLICY "Users can create agent checkpoints"
         ON agent_checkpoints FOR INSERT
-        WITH CHECK (auth.uid() IS NOT NULL)
-    ''')
-    
-    op.execute('''
+        WITH CHECK (auth.uid() IS NOT NULL);
+
         CREATE POLICY "Users can delete agent checkpoints"
         ON agent_checkpoints FOR DELETE
-        USING (auth.uid() IS NOT NULL)
+        USING (auth.uid() IS NOT NULL);
     ''')
 
 
@@ -308,57 +265,61 @@ def downgrade() -> None:
     """Disable RLS and drop all policies."""
     
     # Drop all policies (in reverse order)
-    # Agent checkpoints
-    op.execute('DROP POLICY IF EXISTS "Users can delete agent checkpoints" ON agent_checkpoints')
-    op.execute('DROP POLICY IF EXISTS "Users can create agent checkpoints" ON agent_checkpoints')
-    op.execute('DROP POLICY IF EXISTS "Users can view agent checkpoints" ON agent_checkpoints')
-    
-    # Messages
-    op.execute('DROP POLICY IF EXISTS "Users can delete own conversation messages" ON messages')
-    op.execute('DROP POLICY IF EXISTS "Users can update own conversation messages" ON messages')
-    op.execute('DROP POLICY IF EXISTS "Users can create messages in own conversations" ON messages')
-    op.execute('DROP POLICY IF EXISTS "Users can view own conversation messages" ON messages')
-    
-    # Conversations
-    op.execute('DROP POLICY IF EXISTS "Users can delete own conversations" ON conversations')
-    op.execute('DROP POLICY IF EXISTS "Users can update own conversations" ON conversations')
-    op.execute('DROP POLICY IF EXISTS "Users can create own conversations" ON conversations')
-    op.execute('DROP POLICY IF EXISTS "Users can view own conversations" ON conversations')
-    
-    # Code embeddings
-    op.execute('DROP POLICY IF EXISTS "Users can delete own project embeddings" ON code_embeddings')
-    op.execute('DROP POLICY IF EXISTS "Users can create embeddings in own projects" ON code_embeddings')
-    op.execute('DROP POLICY IF EXISTS "Users can view own project embeddings" ON code_embeddings')
-    
-    # Code chunks
-    op.execute('DROP POLICY IF EXISTS "Users can delete own project code chunks" ON code_chunks')
-    op.execute('DROP POLICY IF EXISTS "Users can update own project code chunks" ON code_chunks')
-    op.execute('DROP POLICY IF EXISTS "Users can create code chunks in own projects" ON code_chunks')
-    op.execute('DROP POLICY IF EXISTS "Users can view own project code chunks" ON code_chunks')
-    
-    # Files
-    op.execute('DROP POLICY IF EXISTS "Users can delete own project files" ON files')
-    op.execute('DROP POLICY IF EXISTS "Users can update own project files" ON files')
-    op.execute('DROP POLICY IF EXISTS "Users can create files in own projects" ON files')
-    op.execute('DROP POLICY IF EXISTS "Users can view own project files" ON files')
-    
-    # Projects
-    op.execute('DROP POLICY IF EXISTS "Users can delete own projects" ON projects')
-    op.execute('DROP POLICY IF EXISTS "Users can update own projects" ON projects')
-    op.execute('DROP POLICY IF EXISTS "Users can create own projects" ON projects')
-    op.execute('DROP POLICY IF EXISTS "Users can view own projects" ON projects')
-    
-    # Users
-    op.execute('DROP POLICY IF EXISTS "Allow user registration" ON users')
-    op.execute('DROP POLICY IF EXISTS "Users can update own profile" ON users')
-    op.execute('DROP POLICY IF EXISTS "Users can view own profile" ON users')
+    _execute_batch('''
+        -- Agent checkpoints
+        DROP POLICY IF EXISTS "Users can delete agent checkpoints" ON agent_checkpoints;
+        DROP POLICY IF EXISTS "Users can create agent checkpoints" ON agent_checkpoints;
+        DROP POLICY IF EXISTS "Users can view agent checkpoints" ON agent_checkpoints;
+
+        -- Messages
+        DROP POLICY IF EXISTS "Users can delete own conversation messages" ON messages;
+        DROP POLICY IF EXISTS "Users can update own conversation messages" ON messages;
+        DROP POLICY IF EXISTS "Users can create messages in own conversations" ON messages;
+        DROP POLICY IF EXISTS "Users can view own conversation messages" ON messages;
+
+        -- Conversations
+        DROP POLICY IF EXISTS "Users can delete own conversations" ON conversations;
+        DROP POLICY IF EXISTS "Users can update own conversations" ON conversations;
+        DROP POLICY IF EXISTS "Users can create own conversations" ON conversations;
+        DROP POLICY IF EXISTS "Users can view own conversations" ON conversations;
+
+        -- Code embeddings
+        DROP POLICY IF EXISTS "Users can delete own project embeddings" ON code_embeddings;
+        DROP POLICY IF EXISTS "Users can create embeddings in own projects" ON code_embeddings;
+        DROP POLICY IF EXISTS "Users can view own project embeddings" ON code_embeddings;
+
+        -- Code chunks
+        DROP POLICY IF EXISTS "Users can delete own project code chunks" ON code_chunks;
+        DROP POLICY IF EXISTS "Users can update own project code chunks" ON code_chunks;
+        DROP POLICY IF EXISTS "Users can create code chunks in own projects" ON code_chunks;
+        DROP POLICY IF EXISTS "Users can view own project code chunks" ON code_chunks;
+
+        -- Files
+        DROP POLICY IF EXISTS "Users can delete own project files" ON files;
+        DROP POLICY IF EXISTS "Users can update own project files" ON files;
+        DROP POLICY IF EXISTS "Users can create files in own projects" ON files;
+        DROP POLICY IF EXISTS "Users can view own project files" ON files;
+
+        -- Projects
+        DROP POLICY IF EXISTS "Users can delete own projects" ON projects;
+        DROP POLICY IF EXISTS "Users can update own projects" ON projects;
+        DROP POLICY IF EXISTS "Users can create own projects" ON projects;
+        DROP POLICY IF EXISTS "Users can view own projects" ON projects;
+
+        -- Users
+        DROP POLICY IF EXISTS "Allow user registration" ON users;
+        DROP POLICY IF EXISTS "Users can update own profile" ON users;
+        DROP POLICY IF EXISTS "Users can view own profile" ON users;
+    ''')
     
     # Disable RLS on all tables
-    op.execute("ALTER TABLE agent_checkpoints DISABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE messages DISABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE conversations DISABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE code_embeddings DISABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE code_chunks DISABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE files DISABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE projects DISABLE ROW LEVEL SECURITY")
-    op.execute("ALTER TABLE users DISABLE ROW LEVEL SECURITY")
+    _execute_batch('''
+        ALTER TABLE agent_checkpoints DISABLE ROW LEVEL SECURITY;
+        ALTER TABLE messages DISABLE ROW LEVEL SECURITY;
+        ALTER TABLE conversations DISABLE ROW LEVEL SECURITY;
+        ALTER TABLE code_embeddings DISABLE ROW LEVEL SECURITY;
+        ALTER TABLE code_chunks DISABLE ROW LEVEL SECURITY;
+        ALTER TABLE files DISABLE ROW LEVEL SECURITY;
+        ALTER TABLE projects DISABLE ROW LEVEL SECURITY;
+        ALTER TABLE users DISABLE ROW LEVEL SECURITY;
+    ''')
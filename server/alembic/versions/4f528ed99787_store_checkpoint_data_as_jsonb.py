@@ -0,0 +1,44 @@
+"""store_checkpoint_data_as_jsonb
+
+Revision ID: 4f528ed99787
+Revises: 4dad8f1bf999
+Create Date: 2026-10-15 09:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f528ed99787'
+down_revision: Union[str, Sequence[str], None] = '4dad8f1bf999'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert checkpoint_data from text to JSONB."""
+    # Existing rows already hold JSON documents, so they cast in place
+    op.alter_column(
+        'agent_checkpoints',
+        'checkpoint_data',
+        type_=postgresql.JSONB(),
+        existing_type=sa.Text(),
+        existing_nullable=False,
+        postgresql_using='checkpoint_data::jsonb',
+    )
+
+
+def downgrade() -> None:
+    """Convert checkpoint_data back to text."""
+    op.alter_column(
+        'agent_checkpoints',
+        'checkpoint_data',
+        type_=sa.Text(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using='checkpoint_data::text',
+    )
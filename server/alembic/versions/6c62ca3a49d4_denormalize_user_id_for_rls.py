@@ -0,0 +1,147 @@
+"""denormalize_user_id_for_rls
+
+Revision ID: 6c62ca3a49d4
+Revises: 7d48bcfd0282
+Create Date: 2026-10-15 10:31:18.640295
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c62ca3a49d4'
+down_revision: Union[str, Sequence[str], None] = '7d48bcfd0282'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Child table -> (parent table, foreign key column on the child)
+OWNED_TABLES = {
+    "files": ("projects", "project_id"),
+    "code_chunks": ("projects", "project_id"),
+    "code_embeddings": ("projects", "project_id"),
+    "messages": ("conversations", "conversation_id"),
+}
+
+# Parent table -> (child table, foreign key column) pairs that follow its user_id
+PARENT_TABLES = {
+    "projects": [("files", "project_id"), ("code_chunks", "project_id"), ("code_embeddings", "project_id")],
+    "conversations": [("messages", "conversation_id")],
+}
+
+# (policy name, table, clause)
+POLICIES = [
+    ("Users can view own project files", "files", "USING"),
+    ("Users can create files in own projects", "files", "WITH CHECK"),
+    ("Users can update own project files", "files", "USING"),
+    ("Users can delete own project files", "files", "USING"),
+    ("Users can view own project code chunks", "code_chunks", "USING"),
+    ("Users can create code chunks in own projects", "code_chunks", "WITH CHECK"),
+    ("Users can update own project code chunks", "code_chunks", "USING"),
+    ("Users can delete own project code chunks", "code_chunks", "USING"),
+    ("Users can view own project embeddings", "code_embeddings", "USING"),
+    ("Users can create embeddings in own projects", "code_embeddings", "WITH CHECK"),
+    ("Users can delete own project embeddings", "code_embeddings", "USING"),
+    ("Users can view own conversation messages", "messages", "USING"),
+    ("Users can create messages in own conversations", "messages", "WITH CHECK"),
+    ("Users can update own conversation messages", "messages", "USING"),
+    ("Users can delete own conversation messages", "messages", "USING"),
+]
+
+
+def _parent_predicate(table: str) -> str:
+    parent, fk = OWNED_TABLES[table]
+    return f"""
+            EXISTS (
+                SELECT 1 FROM {parent}
+                WHERE {parent}.id = {table}.{fk}
+                AND {parent}.user_id = (SELECT auth.uid()::uuid)
+            )
+    """
+
+
+def upgrade() -> None:
+    """Copy the owning user_id onto child tables and check RLS against it."""
+    for table, (parent, fk) in OWNED_TABLES.items():
+        op.add_column(table, sa.Column('user_id', sa.UUID(), nullable=True))
+        
+        # Backfill from the parent row
+        op.execute(f'''
+            UPDATE {table} AS child
+            SET user_id = parent.user_id
+            FROM {parent} AS parent
+            WHERE child.{fk} = parent.id
+        ''')
+        
+        op.alter_column(table, 'user_id', nullable=False)
+        op.create_foreign_key(
+            f'fk_{table}_user_id_users',
+            table,
+            'users',
+            ['user_id'],
+            ['id'],
+            ondelete='CASCADE',
+        )
+        op.create_index(f'ix_{table}_user_id', table, ['user_id'], unique=False)
+        
+        # Keep user_id in sync with the parent on every insert or re-parent.
+        # SECURITY DEFINER functions pin search_path so objects created by
+        # other roles cannot shadow the tables they read.
+        op.execute(f'''
+            CREATE OR REPLACE FUNCTION set_{table}_user_id() RETURNS trigger AS $$
+            BEGIN
+                SELECT user_id INTO NEW.user_id FROM public.{parent} WHERE id = NEW.{fk};
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp
+        ''')
+        op.execute(f'''
+            CREATE TRIGGER trg_{table}_user_id
+            BEFORE INSERT OR UPDATE OF {fk} ON {table}
+            FOR EACH ROW EXECUTE FUNCTION set_{table}_user_id()
+        ''')
+    
+    # Propagate ownership changes on a parent to its children
+    for parent, children in PARENT_TABLES.items():
+        updates = "\n                ".join(
+            f"UPDATE public.{table} SET user_id = NEW.user_id WHERE {fk} = NEW.id;"
+            for table, fk in children
+        )
+        op.execute(f'''
+            CREATE OR REPLACE FUNCTION cascade_{parent}_user_id() RETURNS trigger AS $$
+            BEGIN
+                {updates}
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp
+        ''')
+        op.execute(f'''
+            CREATE TRIGGER trg_{parent}_cascade_user_id
+            AFTER UPDATE OF user_id ON {parent}
+            FOR EACH ROW
+            WHEN (OLD.user_id IS DISTINCT FROM NEW.user_id)
+            EXECUTE FUNCTION cascade_{parent}_user_id()
+        ''')
+    
+    for name, table, clause in POLICIES:
+        op.execute(f'ALTER POLICY "{name}" ON {table} {clause} ((SELECT auth.uid()::uuid) = user_id)')
+
+
+def downgrade() -> None:
+    """Restore parent-lookup RLS predicates and drop the denormalized user_id."""
+    for name, table, clause in POLICIES:
+        op.execute(f'ALTER POLICY "{name}" ON {table} {clause} ({_parent_predicate(table)})')
+    
+    for parent in PARENT_TABLES:
+        op.execute(f'DROP TRIGGER IF EXISTS trg_{parent}_cascade_user_id ON {parent}')
+        op.execute(f'DROP FUNCTION IF EXISTS cascade_{parent}_user_id()')
+    
+    for table in OWNED_TABLES:
+        op.execute(f'DROP TRIGGER IF EXISTS trg_{table}_user_id ON {table}')
+        op.execute(f'DROP FUNCTION IF EXISTS set_{table}_user_id()')
+        op.drop_index(f'ix_{table}_user_id', table_name=table)
+        op.drop_constraint(f'fk_{table}_user_id_users', table, type_='foreignkey')
+        op.drop_column(table, 'user_id')
@@ -0,0 +1,103 @@
+"""evaluate_rls_auth_uid_once
+
+Revision ID: 7d48bcfd0282
+Revises: 29ce96adcec2
+Create Date: 2026-10-15 10:05:52.873140
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d48bcfd0282'
+down_revision: Union[str, Sequence[str], None] = '29ce96adcec2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Wrapping auth.uid() in a scalar subquery lets the planner evaluate it
+# once per statement (as an InitPlan) instead of once per row.
+CACHED_UID = "(SELECT auth.uid()::uuid)"
+PER_ROW_UID = "auth.uid()::uuid"
+
+
+def _owned_by(column: str, uid: str) -> str:
+    return f"{uid} = {column}"
+
+
+def _in_own_project(table: str, uid: str) -> str:
+    return f"""
+            EXISTS (
+                SELECT 1 FROM projects
+                WHERE projects.id = {table}.project_id
+                AND projects.user_id = {uid}
+            )
+    """
+
+
+def _in_own_conversation(uid: str) -> str:
+    return f"""
+            EXISTS (
+                SELECT 1 FROM conversations
+                WHERE conversations.id = messages.conversation_id
+                AND conversations.user_id = {uid}
+            )
+    """
+
+
+def _authenticated(uid: str) -> str:
+    # Original policies compare the raw (uncast) uid against NULL
+    return "(SELECT auth.uid()) IS NOT NULL" if uid == CACHED_UID else "auth.uid() IS NOT NULL"
+
+
+# (policy name, table, clause, predicate builder)
+POLICIES = [
+    ("Users can view own profile", "users", "USING", lambda uid: _owned_by("id", uid)),
+    ("Users can update own profile", "users", "USING", lambda uid: _owned_by("id", uid)),
+    ("Users can view own projects", "projects", "USING", lambda uid: _owned_by("user_id", uid)),
+    ("Users can create own projects", "projects", "WITH CHECK", lambda uid: _owned_by("user_id", uid)),
+    ("Users can update own projects", "projects", "USING", lambda uid: _owned_by("user_id", uid)),
+    ("Users can delete own projects", "projects", "USING", lambda uid: _owned_by("user_id", uid)),
+    ("Users can view own project files", "files", "USING", lambda uid: _in_own_project("files", uid)),
+    ("Users can create files in own projects", "files", "WITH CHECK", lambda uid: _in_own_project("files", uid)),
+    ("Users can update own project files", "files", "USING", lambda uid: _in_own_project("files", uid)),
+    ("Users can delete own project files", "files", "USING", lambda uid: _in_own_project("files", uid)),
+    ("Users can view own project code chunks", "code_chunks", "USING", lambda uid: _in_own_project("code_chunks", uid)),
+    ("Users can create code chunks in own projects", "code_chunks", "WITH CHECK", lambda uid: _in_own_project("code_chunks", uid)),
+    ("Users can update own project code chunks", "code_chunks", "USING", lambda uid: _in_own_project("code_chunks", uid)),
+    ("Users can delete own project code chunks", "code_chunks", "USING", lambda uid: _in_own_project("code_chunks", uid)),
+    ("Users can view own project embeddings", "code_embeddings", "USING", lambda uid: _in_own_project("code_embeddings", uid)),
+    ("Users can create embeddings in own projects", "code_embeddings", "WITH CHECK", lambda uid: _in_own_project("code_embeddings", uid)),
+    ("Users can delete own project embeddings", "code_embeddings", "USING", lambda uid: _in_own_project("code_embeddings", uid)),
+    ("Users can view own conversations", "conversations", "USING", lambda uid: _owned_by("user_id", uid)),
+    ("Users can create own conversations", "conversations", "WITH CHECK", lambda uid: _owned_by("user_id", uid)),
+    ("Users can update own conversations", "conversations", "USING", lambda uid: _owned_by("user_id", uid)),
+    ("Users can delete own conversations", "conversations", "USING", lambda uid: _owned_by("user_id", uid)),
+    ("Users can view own conversation messages", "messages", "USING", _in_own_conversation),
+    ("Users can create messages in own conversations", "messages", "WITH CHECK", _in_own_conversation),
+    ("Users can update own conversation messages", "messages", "USING", _in_own_conversation),
+    ("Users can delete own conversation messages", "messages", "USING", _in_own_conversation),
+    ("Users can view agent checkpoints", "agent_checkpoints", "USING", _authenticated),
+    ("Users can create agent checkpoints", "agent_checkpoints", "WITH CHECK", _authenticated),
+    ("Users can delete agent checkpoints", "agent_checkpoints", "USING", _authenticated),
+]
+
+
+def _alter_policies(uid: str) -> None:
+    for name, table, clause, predicate in POLICIES:
+        op.execute(f'ALTER POLICY "{name}" ON {table} {clause} ({predicate(uid)})')
+
+
+def upgrade() -> None:
+    """Rewrite RLS policies to evaluate auth.uid() once per statement."""
+    # Indexes on projects.user_id and conversations.user_id already exist
+    # (initial migration), so the cached uid comparison is an index probe.
+    _alter_policies(CACHED_UID)
+
+
+def downgrade() -> None:
+    """Restore per-row auth.uid() evaluation in RLS policies."""
+    _alter_policies(PER_ROW_UID)
@@ -0,0 +1,55 @@
+"""store_embeddings_as_halfvec
+
+Revision ID: b3e1f6a2c9d4
+Revises: 6c62ca3a49d4
+Create Date: 2026-10-15 14:12:31.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e1f6a2c9d4'
+down_revision: Union[str, Sequence[str], None] = '6c62ca3a49d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store embeddings as half-precision vectors."""
+    # The ivfflat index is tied to the column's operator class, so rebuild it
+    op.drop_index('ix_embeddings_vector', table_name='code_embeddings')
+    op.execute(
+        'ALTER TABLE code_embeddings '
+        'ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536)'
+    )
+    op.create_index(
+        'ix_embeddings_vector',
+        'code_embeddings',
+        ['embedding'],
+        unique=False,
+        postgresql_using='ivfflat',
+        postgresql_with={'lists': 100},
+        postgresql_ops={'embedding': 'halfvec_cosine_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Restore single-precision vectors."""
+    op.drop_index('ix_embeddings_vector', table_name='code_embeddings')
+    op.execute(
+        'ALTER TABLE code_embeddings '
+        'ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536)'
+    )
+    op.create_index(
+        'ix_embeddings_vector',
+        'code_embeddings',
+        ['embedding'],
+        unique=False,
+        postgresql_using='ivfflat',
+        postgresql_with={'lists': 100},
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
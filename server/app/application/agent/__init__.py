@@ -3,7 +3,6 @@
 from app.application.agent.graph import ByteBuddhiAgent, create_agent_graph
 from app.application.agent.nodes import AgentNodes
 from app.application.agent.state import AgentState, IntentType
-from app.infrastructure.external.tavily_search import TavilySearchService
 
 __all__ = [
     "ByteBuddhiAgent",
@@ -13,3 +12,12 @@ __all__ = [
     "IntentType",
     "TavilySearchService",
 ]
+
+
+def __getattr__(name: str):
+    """Lazily import TavilySearchService so the agent does not pull in Tavily."""
+    if name == "TavilySearchService":
+        from app.infrastructure.external.tavily_search import TavilySearchService
+
+        return TavilySearchService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
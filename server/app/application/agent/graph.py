@@ -4,46 +4,45 @@ This module builds the LangGraph agent by connecting nodes into
 a directed graph that defines the agent's workflow.
 """
 
-from typing import Optional
+from dataclasses import replace
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Optional
 
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
+from langgraph.graph.message import add_messages
 
-from app.application.agent.nodes import AgentNodes
+from app.application.agent.nodes import (
+    classify_and_maybe_retrieve,
+    generate_response,
+    handle_error,
+    web_search,
+)
 from app.application.agent.state import AgentState, IntentType
 from app.application.ports.output.llm.llm_provider import LLMProvider
 from app.infrastructure.config.logger import get_logger
+from app.infrastructure.config.settings import settings
 
 logger = get_logger(__name__)
 
 
-def should_retrieve_context(state: AgentState) -> str:
-    """Determine if context retrieval is needed.
+def should_search_web(state: AgentState) -> str:
+    """Determine if a web search is needed.
     
-    This conditional edge decides whether to retrieve code context
-    based on the classified intent.
+    This conditional edge decides whether to search the web before
+    generating a response, based on the classified intent. Code context
+    and, when speculative search is enabled, web results have already
+    been fetched alongside classification.
     
     Args:
         state: Current agent state
         
     Returns:
-        str: Next node name ('retrieve_context', 'web_search', or 'generate_response')
+        str: Next node name ('web_search' or 'generate_response')
     """
-    intent = state.get("intent")
-    
-    # Perform web search for web_search intent
-    if intent == IntentType.WEB_SEARCH:
+    if state.intent == IntentType.WEB_SEARCH and state.search_results is None:
         return "web_search"
     
-    # Retrieve context for code-related intents
-    if intent in [
-        IntentType.CODE_EXPLANATION,
-        IntentType.CODE_DEBUG,
-        IntentType.CODE_REFACTOR,
-    ]:
-        return "retrieve_context"
-    
-    # Skip context retrieval for other intents
     return "generate_response"
 
 
@@ -58,8 +57,9 @@ def create_agent_graph(
     and edges that represent the agent's workflow.
     
     The workflow is:
-    1. Classify user intent
-    2. Conditionally retrieve code context or perform web search
+    1. Classify user intent while speculatively retrieving code context
+       and searching the web
+    2. Perform web search if it is needed and was not done speculatively
     3. Generate response
     4. Handle errors if they occur
     
@@ -73,37 +73,39 @@ def create_agent_graph(
     """
     logger.info("Creating agent graph", with_checkpoints=checkpoint_saver is not None)
     
-    # Initialize nodes
-    nodes = AgentNodes(llm_provider, search_service)
-    
     # Create graph
     workflow = StateGraph(AgentState)
     
-    # Add nodes
-    workflow.add_node("classify_intent", nodes.classify_intent)
-    workflow.add_node("retrieve_context", nodes.retrieve_context)
-    workflow.add_node("web_search", nodes.web_search)
-    workflow.add_node("generate_response", nodes.generate_response)
-    workflow.add_node("handle_error", nodes.handle_error)
+    # Add nodes, binding their dependencies
+    workflow.add_node(
+        "classify_and_maybe_retrieve",
+        partial(
+            classify_and_maybe_retrieve,
+            llm_provider,
+            search_service if settings.tavily_speculative_search else None,
+        ),
+    )
+    workflow.add_node("web_search", partial(web_search, search_service))
+    workflow.add_node(
+        "generate_response",
+        partial(generate_response, llm_provider, search_service),
+    )
+    workflow.add_node("handle_error", handle_error)
     
     # Set entry point
-    workflow.set_entry_point("classify_intent")
+    workflow.set_entry_point("classify_and_maybe_retrieve")
     
     # Add edges
-    # After classification, decide whether to retrieve context, search web, or generate response
+    # After classification, decide whether to search web or generate response
     workflow.add_conditional_edges(
-        "classify_intent",
-        should_retrieve_context,
+        "classify_and_maybe_retrieve",
+        should_search_web,
         {
-            "retrieve_context": "retrieve_context",
             "web_search": "web_search",
             "generate_response": "generate_response",
         },
     )
     
-    # After retrieving context, generate response
-    workflow.add_edge("retrieve_context", "generate_response")
-    
     # After web search, generate response
     workflow.add_edge("web_search", "generate_response")
     
@@ -133,7 +135,7 @@ class ByteBuddhiAgent:
     interface for processing user queries with optional state persistence.
     
     Attributes:
-        graph: Compiled LangGraph agent
+        graph: Compiled LangGraph agent (checkpointed when a saver is configured)
         llm_provider: LLM provider for the agent
         checkpoint_saver: Optional checkpoint saver for persistence
         search_service: Optional Tavily search service for web searches
@@ -155,7 +157,94 @@ class ByteBuddhiAgent:
         self.llm_provider = llm_provider
         self.checkpoint_saver = checkpoint_saver
         self.search_service = search_service
-        self.graph = create_agent_graph(llm_provider, checkpoint_saver, search_service)
+        
+        # Stateless queries run on a graph compiled without a checkpointer
+        self._graph_ephemeral = create_agent_graph(llm_provider, None, search_service)
+        self._graph_persistent = (
+            create_agent_graph(llm_provider, checkpoint_saver, search_service)
+            if checkpoint_saver
+            else None
+        )
+        self.graph = self._graph_persistent or self._graph_ephemeral
+
+    @staticmethod
+    def _build_initial_state(
+        user_query: str,
+        project_id: Optional[str],
+        conversation_history: Optional[list],
+    ) -> AgentState:
+        """Build the initial agent state for a query.
+        
+        Args:
+            user_query: User's question or request
+            project_id: Optional project ID for context
+            conversation_history: Optional conversation history
+            
+        Returns:
+            AgentState: Initial agent state
+        """
+        return AgentState(
+            user_query=user_query,
+            project_id=project_id,
+            messages=conversation_history or [],
+        )
+
+    def _build_config(self, thread_id: Optional[str]) -> Dict[str, Any]:
+        """Build the graph run config.
+        
+        Args:
+            thread_id: Optional thread ID for checkpoint persistence
+            
+        Returns:
+            Dict[str, Any]: Run config, with thread_id when checkpoints are enabled
+        """
+        config = {}
+        if thread_id and self.checkpoint_saver:
+            config["configurable"] = {"thread_id": thread_id}
+            logger.info("Using checkpoint persistence", thread_id=thread_id)
+        return config
+
+    def _select_graph(self, thread_id: Optional[str]):
+        """Pick the compiled graph for a run.
+        
+        Args:
+            thread_id: Optional thread ID for checkpoint persistence
+            
+        Returns:
+            Compiled graph, with checkpointing only when a thread is given
+        """
+        if thread_id and self._graph_persistent is not None:
+            return self._graph_persistent
+        return self._graph_ephemeral
+
+    async def _flush_checkpoints(self) -> None:
+        """Write checkpoints buffered by the saver during a run, if any."""
+        flush = getattr(self.checkpoint_saver, "aflush", None)
+        if flush is not None:
+            await flush()
+
+    async def _handle_failure(self, state: AgentState, error: Exception) -> AgentState:
+        """Build the final state for a failed run.
+        
+        Args:
+            state: Initial agent state of the failed run
+            error: Exception raised by the graph
+            
+        Returns:
+            AgentState: State carrying the user-facing error message
+        """
+        logger.error("Agent execution failed", error=str(error))
+        
+        # Run error handler
+        error_state = replace(state, error=str(error))
+        
+        error_result = await handle_error(error_state)
+        
+        return replace(
+            error_state,
+            explanation=error_result["explanation"],
+            messages=add_messages(error_state.messages, error_result["messages"]),
+        )
 
     async def process_query(
         self,
@@ -177,43 +266,82 @@ class ByteBuddhiAgent:
         """
         logger.info("Processing user query", project_id=project_id, thread_id=thread_id)
         
-        # Initialize state
-        initial_state: AgentState = {
-            "messages": conversation_history or [],
-            "user_query": user_query,
-            "intent": None,
-            "project_id": project_id,
-            "retrieved_context": [],
-            "search_results": None,
-            "generated_code": None,
-            "explanation": None,
-            "error": None,
-            "metadata": {},
-        }
-        
-        # Build config with optional thread_id for checkpoints
-        config = {}
-        if thread_id and self.checkpoint_saver:
-            config["configurable"] = {"thread_id": thread_id}
-            logger.info("Using checkpoint persistence", thread_id=thread_id)
+        return await self._run(user_query, project_id, conversation_history, thread_id)
+
+    async def _run(
+        self,
+        user_query: str,
+        project_id: Optional[str],
+        conversation_history: Optional[list],
+        thread_id: Optional[str],
+    ) -> AgentState:
+        """Run the graph once for a query, without entry logging.
+        
+        Args:
+            user_query: User's question or request
+            project_id: Optional project ID for context
+            conversation_history: Optional conversation history
+            thread_id: Optional thread ID for checkpoint persistence
+            
+        Returns:
+            AgentState: Final agent state with response
+        """
+        initial_state = self._build_initial_state(user_query, project_id, conversation_history)
+        config = self._build_config(thread_id)
         
         try:
             # Run agent
-            final_state = await self.graph.ainvoke(initial_state, config=config)
-            return final_state
+            graph = self._select_graph(thread_id)
+            final_state = await graph.ainvoke(initial_state, config=config)
+            return AgentState(**final_state)
             
         except Exception as e:
-            logger.error("Agent execution failed", error=str(e))
+            return await self._handle_failure(initial_state, e)
             
-            # Run error handler
-            error_state = initial_state.copy()
-            error_state["error"] = str(e)
+        finally:
+            await self._flush_checkpoints()
+
+    async def astream_query(
+        self,
+        user_query: str,
+        project_id: str = None,
+        conversation_history: list = None,
+        thread_id: str = None,
+    ) -> AsyncIterator[str]:
+        """Process a user query and stream the response as it is generated.
+        
+        The checkpoint, if any, is still written once the run completes.
+        
+        Args:
+            user_query: User's question or request
+            project_id: Optional project ID for context
+            conversation_history: Optional conversation history
+            thread_id: Optional thread ID for checkpoint persistence
             
-            nodes = AgentNodes(self.llm_provider)
-            error_result = await nodes.handle_error(error_state)
-            error_state.update(error_result)
+        Yields:
+            str: Chunks of the generated response
+        """
+        logger.info("Streaming user query", project_id=project_id, thread_id=thread_id)
+        
+        initial_state = self._build_initial_state(user_query, project_id, conversation_history)
+        config = self._build_config(thread_id)
+        
+        try:
+            graph = self._select_graph(thread_id)
+            async for event in graph.astream(
+                initial_state,
+                config=config,
+                stream_mode="custom",
+            ):
+                if delta := event.get("explanation_delta"):
+                    yield delta
+                    
+        except Exception as e:
+            error_state = await self._handle_failure(initial_state, e)
+            yield error_state.explanation
             
-            return error_state
+        finally:
+            await self._flush_checkpoints()
 
     async def resume_conversation(
         self,
@@ -233,13 +361,9 @@ class ByteBuddhiAgent:
             AgentState: Final agent state with response
         """
         if not self.checkpoint_saver:
-            logger.warning("Cannot resume conversation without checkpoint saver")
             return await self.process_query(user_query, thread_id=thread_id)
         
         logger.info("Resuming conversation", thread_id=thread_id)
         
-        # Process query with thread_id to load checkpoint
-        return await self.process_query(
-            user_query=user_query,
-            thread_id=thread_id,
-        )
+        # Run with thread_id to load checkpoint
+        return await self._run(user_query, None, None, thread_id)
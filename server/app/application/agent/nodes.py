@@ -2,60 +2,46 @@
 
 This module implements the individual nodes (functions) that make up
 the ByteBuddhi agent graph. Each node performs a specific task in the
-agent's workflow.
+agent's workflow. Dependencies such as the LLM provider are passed as
+leading arguments and bound with functools.partial when the graph is built.
 """
 
-from typing import Dict, Optional
+import asyncio
+import hashlib
+import re
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
+from cachetools import LRUCache, TTLCache
 from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.config import get_stream_writer
 
 from app.application.agent.state import AgentState, IntentType
 from app.application.ports.output.llm.llm_provider import LLMProvider
 from app.infrastructure.config.logger import get_logger
-from app.infrastructure.external.tavily_search import TavilySearchService
+
+if TYPE_CHECKING:
+    from app.infrastructure.external.tavily_search import TavilySearchService
 
 logger = get_logger(__name__)
 
+# Classified intents keyed by a hash of the normalized user query
+_INTENT_CACHE: LRUCache = LRUCache(maxsize=1024)
 
-class AgentNodes:
-    """Collection of agent node functions.
-    
-    Each method in this class represents a node in the LangGraph agent.
-    Nodes take the current state and return an updated state.
-    """
+# Classifications in progress, so concurrent cold misses share one LLM call
+_INTENT_INFLIGHT: Dict[bytes, asyncio.Future] = {}
 
-    def __init__(
-        self,
-        llm_provider: LLMProvider,
-        search_service: Optional[TavilySearchService] = None,
-    ):
-        """Initialize agent nodes with LLM provider and search service.
-        
-        Args:
-            llm_provider: LLM provider for generating responses
-            search_service: Optional Tavily search service for web searches
-        """
-        self.llm = llm_provider
-        self.search_service = search_service
+# Generated responses keyed by a hash of the model and final prompt
+_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=256, ttl=3600)
 
-    async def classify_intent(self, state: AgentState) -> Dict:
-        """Classify the user's intent.
-        
-        This node analyzes the user query to determine what type of
-        assistance they need (code generation, explanation, debugging, etc.).
-        
-        Args:
-            state: Current agent state
-            
-        Returns:
-            Dict: Updated state with classified intent
-        """
-        logger.info("Classifying user intent")
-        
-        user_query = state["user_query"]
-        
-        # Build classification prompt
-        classification_prompt = f"""Classify the following user request into one of these categories:
+# Bump when prompt construction changes so stale responses are not reused
+_RESPONSE_CACHE_VERSION = "1"
+
+# Responses being generated, so identical concurrent prompts share one LLM call
+_RESPONSE_INFLIGHT: Dict[bytes, asyncio.Future] = {}
+
+
+# Prompt used when the LLM classifies a query
+_CLASSIFY_TEMPLATE = """Classify the following user request into one of these categories:
 - code_generation: User wants to generate new code
 - code_explanation: User wants to understand existing code
 - code_debug: User needs help debugging an issue
@@ -64,178 +50,601 @@ class AgentNodes:
 - web_search: User is asking about current information, latest updates, or needs real-time data
 - general_chat: General conversation
 
-User request: {user_query}
+User request: {user_query}"""
+
+# Labels the classifier output is constrained to
+_INTENT_LABELS = IntentType.all_intents()
+
+
+# Keyword patterns for queries that can be classified without the LLM
+_INTENT_PATTERNS = [
+    (
+        IntentType.CODE_DEBUG,
+        re.compile(r"\b(bug|error|traceback|exception|fix|broken|crash(es|ing)?|not working)\b", re.I),
+    ),
+    (
+        IntentType.CODE_EXPLANATION,
+        re.compile(r"\b(explain|what does|how does|walk me through)\b", re.I),
+    ),
+    (
+        IntentType.CODE_REFACTOR,
+        re.compile(r"\b(refactor|clean up|simplify|make (this|it) (cleaner|more readable))\b", re.I),
+    ),
+    (
+        IntentType.CODE_GENERATION,
+        re.compile(r"\b(write|generate|implement|create) (a|an|me|some)\b", re.I),
+    ),
+    (
+        IntentType.WEB_SEARCH,
+        re.compile(r"\b(latest|newest|news|release notes|this week|today)\b", re.I),
+    ),
+    (
+        IntentType.GENERAL_CHAT,
+        re.compile(r"^\s*(hi|hello|hey|thanks|thank you|good (morning|afternoon|evening))\b[\s!.]*$", re.I),
+    ),
+]
+
+
+# Intents that use retrieved code context
+CONTEXT_INTENTS = frozenset(
+    {
+        IntentType.CODE_EXPLANATION,
+        IntentType.CODE_DEBUG,
+        IntentType.CODE_REFACTOR,
+    }
+)
+
+
+# System prompts used by generate_response, keyed by intent
+_SYSTEM_PROMPTS: Dict[str, str] = {
+    IntentType.CODE_GENERATION: "You are an expert programmer. Generate clean, well-documented code based on the user's request.",
+    IntentType.CODE_EXPLANATION: "You are an expert programmer. Explain code clearly and concisely.",
+    IntentType.CODE_DEBUG: "You are an expert debugger. Help identify and fix issues in code.",
+    IntentType.CODE_REFACTOR: "You are an expert in code quality. Suggest improvements and refactorings.",
+    IntentType.WEB_SEARCH: "You are a helpful assistant with access to current web information. Provide accurate, up-to-date answers based on the search results.",
+}
+
+_DEFAULT_SYSTEM_PROMPT = "You are a helpful programming assistant."
 
-Respond with only the category name."""
+# Code context block pieces used by _build_messages
+_CONTEXT_HEADER = "\n\nRelevant code context:"
+_FENCE_OPEN = "\n\n```\n"
+_FENCE_CLOSE = "\n```"
 
-        # Get classification from LLM
-        messages = [{"role": "user", "content": classification_prompt}]
-        intent = await self.llm.generate(messages)
-        intent = intent.strip().lower()
+# Shared system message for prompts that carry no extra context
+_GENERIC_SYSTEM_MSG = {"role": "system", "content": _DEFAULT_SYSTEM_PROMPT}
+
+# User-facing message returned by handle_error
+_ERROR_TEXT = "I encountered an error while processing your request. Please try again or rephrase your question."
+
+# Intents answered with the generic prompt when there is no context
+_GENERIC_INTENTS = frozenset({IntentType.GENERAL_CHAT, IntentType.QUESTION_ANSWER})
+
+
+def _prefilter_intent(user_query: str) -> Optional[str]:
+    """Classify a query locally using keyword patterns.
+    
+    Args:
+        user_query: Raw user query
         
-        # Validate intent
-        if intent not in IntentType.all_intents():
-            logger.warning(f"Unknown intent: {intent}, defaulting to general_chat")
-            intent = IntentType.GENERAL_CHAT
+    Returns:
+        Optional[str]: Intent if exactly one pattern group matches, None otherwise
+    """
+    matched = None
+    for intent, pattern in _INTENT_PATTERNS:
+        if pattern.search(user_query):
+            if matched is not None:
+                # Ambiguous, let the LLM decide
+                return None
+            matched = intent
+    return matched
+
+
+def _intent_cache_key(user_query: str, model_id: str) -> bytes:
+    """Build the intent cache key for a user query.
+    
+    Args:
+        user_query: Raw user query
+        model_id: Identifier of the classifying model
         
-        logger.info(f"Classified intent: {intent}")
+    Returns:
+        bytes: Digest of the model and normalized query
+    """
+    return hashlib.blake2b(
+        f"{model_id}\0{user_query.strip().lower()}".encode(), digest_size=16
+    ).digest()
+
+
+def invalidate_intent_cache() -> None:
+    """Drop all cached intent classifications.
+    
+    Call this when the classification prompt or model changes.
+    """
+    _INTENT_CACHE.clear()
+    logger.info("Intent cache invalidated")
+
+
+async def classify_intent(llm: LLMProvider, state: AgentState) -> Dict:
+    """Classify the user's intent.
+    
+    This node analyzes the user query to determine what type of
+    assistance they need (code generation, explanation, debugging, etc.).
+    
+    Args:
+        llm: LLM provider used when local classification is not possible
+        state: Current agent state
         
-        return {"intent": intent}
+    Returns:
+        Dict: Updated state with classified intent
+    """
+    logger.info("Classifying user intent")
+    
+    user_query = state.user_query
+    
+    local_intent = _prefilter_intent(user_query)
+    if local_intent is not None:
+        logger.info("Classified intent", intent=local_intent, source="local")
+        return {"intent": local_intent}
+    
+    key = _intent_cache_key(user_query, getattr(llm, "model_name", ""))
+    
+    cached_intent = _INTENT_CACHE.get(key)
+    if cached_intent is not None:
+        logger.info("Classified intent", intent=cached_intent, source="cache")
+        return {"intent": cached_intent}
+    
+    while True:
+        inflight = _INTENT_INFLIGHT.get(key)
+        if inflight is None:
+            break
+        
+        # wait() leaves the shared future alone if this request is cancelled
+        await asyncio.wait((inflight,))
+        if not inflight.cancelled():
+            # Raises the classifying request's error instead of retrying
+            intent = inflight.result()
+            logger.info("Classified intent", intent=intent, source="shared")
+            return {"intent": intent}
+        # The classifying request was cancelled, so take over from it
+    
+    inflight = asyncio.get_running_loop().create_future()
+    _INTENT_INFLIGHT[key] = inflight
+    try:
+        intent = await _classify_with_llm(llm, user_query)
+        _INTENT_CACHE[key] = intent
+        inflight.set_result(intent)
+    except Exception as e:
+        inflight.set_exception(e)
+        # Mark it retrieved so it is not logged again when nobody waited
+        inflight.exception()
+        raise
+    finally:
+        del _INTENT_INFLIGHT[key]
+        if not inflight.done():
+            inflight.cancel()
+    
+    logger.info("Classified intent", intent=intent, source="llm")
+    
+    return {"intent": intent}
 
-    async def retrieve_context(self, state: AgentState) -> Dict:
-        """Retrieve relevant code context from vector store.
+
+async def _classify_with_llm(llm: LLMProvider, user_query: str) -> str:
+    """Ask the LLM to classify a user query.
+    
+    Args:
+        llm: LLM provider
+        user_query: User query to classify
         
-        This node searches the vector store for code chunks relevant
-        to the user's query.
+    Returns:
+        str: Intent type
+    """
+    classification_prompt = _CLASSIFY_TEMPLATE.format(user_query=user_query)
+    
+    # Output is constrained to the intent labels by the provider
+    messages = [{"role": "user", "content": classification_prompt}]
+    intent = await llm.generate_classification(
+        messages,
+        labels=_INTENT_LABELS,
+    )
+    
+    try:
+        return IntentType(intent)
+    except ValueError:
+        # Fallback is cached like any other result so the query is not retried
+        logger.warning("Unrecognized intent label, using fallback", label=intent)
+        return IntentType.GENERAL_CHAT
+
+
+async def classify_and_maybe_retrieve(
+    llm: LLMProvider,
+    search_service: Optional["TavilySearchService"],
+    state: AgentState,
+) -> Dict:
+    """Classify intent while speculatively retrieving code context.
+    
+    Retrieval does not depend on the classification result, so both
+    run concurrently. When a search service is given and the query
+    needs the LLM to classify it, a web search is started alongside
+    them as well. Results the intent turns out not to need are
+    discarded, and the pending search is cancelled.
+    
+    Args:
+        llm: LLM provider used for classification
+        search_service: Optional Tavily search service for speculative search
+        state: Current agent state
+        
+    Returns:
+        Dict: Updated state with intent, retrieved context and, for
+            web search intents, search results
+    """
+    # Locally classified queries resolve immediately, so speculating on
+    # them would only add searches that are paid for and thrown away
+    search_task = None
+    if search_service is not None and _prefilter_intent(state.user_query) is None:
+        search_task = asyncio.create_task(web_search(search_service, state))
+    
+    try:
+        intent_result, context_result = await asyncio.gather(
+            classify_intent(llm, state),
+            retrieve_context(state),
+        )
         
-        Note: Vector store retrieval will be implemented when the
-        vector store repository is complete.
+        intent = intent_result["intent"]
+        if intent not in CONTEXT_INTENTS:
+            context_result = {"retrieved_context": []}
         
-        Args:
-            state: Current agent state
-            
-        Returns:
-            Dict: Updated state with retrieved context
-        """
-        logger.info("Retrieving code context")
+        result = {**intent_result, **context_result}
+        if search_task is not None and intent == IntentType.WEB_SEARCH:
+            result.update(await search_task)
         
-        # Placeholder: return empty context until vector store is implemented
-        retrieved_context = []
+        return result
         
-        logger.info(f"Retrieved {len(retrieved_context)} code chunks")
+    finally:
+        if search_task is not None and not search_task.done():
+            search_task.cancel()
+
+
+async def retrieve_context(state: AgentState) -> Dict:
+    """Retrieve relevant code context from vector store.
+    
+    This node searches the vector store for code chunks relevant
+    to the user's query.
+    
+    Note: Vector store retrieval will be implemented when the
+    vector store repository is complete.
+    
+    Args:
+        state: Current agent state
         
-        return {"retrieved_context": retrieved_context}
+    Returns:
+        Dict: Updated state with retrieved context
+    """
+    logger.info("Retrieving code context")
+    
+    # Placeholder: return empty context until vector store is implemented
+    retrieved_context = []
+    
+    logger.info("Retrieved code context", num_chunks=len(retrieved_context))
+    
+    return {"retrieved_context": retrieved_context}
 
-    async def web_search(self, state: AgentState) -> Dict:
-        """Perform web search using Tavily.
+
+async def web_search(
+    search_service: Optional["TavilySearchService"],
+    state: AgentState,
+) -> Dict:
+    """Perform web search using Tavily.
+    
+    This node uses the Tavily API to search the web for information
+    relevant to the user's query.
+    
+    Args:
+        search_service: Optional Tavily search service
+        state: Current agent state
         
-        This node uses the Tavily API to search the web for information
-        relevant to the user's query.
+    Returns:
+        Dict: Updated state with search results
+    """
+    logger.info("Performing web search")
+    
+    if not search_service:
+        logger.warning("Web search requested but Tavily service not configured")
+        return {
+            "search_results": None,
+            "error": "Web search is not configured",
+        }
+    
+    user_query = state.user_query
+    
+    try:
+        # Perform search
+        search_response = await search_service.search(
+            query=user_query,
+            include_answer=True,
+        )
+        
+        logger.info(
+            "Web search completed",
+            num_results=len(search_response.get("results", [])),
+        )
+        
+        return {"search_results": search_response}
+        
+    except asyncio.CancelledError:
+        logger.debug("Speculative web search cancelled")
+        raise
+        
+    except Exception as e:
+        logger.error("Web search failed", error=str(e))
+        return {
+            "search_results": None,
+            "error": f"Web search failed: {str(e)}",
+        }
+
+
+async def generate_response(
+    llm: LLMProvider,
+    search_service: Optional["TavilySearchService"],
+    state: AgentState,
+) -> Dict:
+    """Generate the final response to the user.
+    
+    This node uses the LLM to generate a response based on the
+    user query, intent, and retrieved context.
+    
+    Args:
+        llm: LLM provider for generating the response
+        search_service: Optional Tavily search service for formatting results
+        state: Current agent state
         
-        Args:
-            state: Current agent state
-            
-        Returns:
-            Dict: Updated state with search results
-        """
-        logger.info("Performing web search")
-        
-        if not self.search_service:
-            logger.warning("Web search requested but Tavily service not configured")
-            return {
-                "search_results": None,
-                "error": "Web search is not configured",
-            }
-        
-        user_query = state["user_query"]
-        
-        try:
-            # Perform search
-            search_response = await self.search_service.search(
-                query=user_query,
-                include_answer=True,
-            )
-            
-            logger.info(
-                "Web search completed",
-                num_results=len(search_response.get("results", [])),
-            )
-            
-            return {"search_results": search_response}
-            
-        except Exception as e:
-            logger.error("Web search failed", error=str(e))
-            return {
-                "search_results": None,
-                "error": f"Web search failed: {str(e)}",
-            }
+    Returns:
+        Dict: Updated state with generated response
+    """
+    logger.info("Generating response")
+    
+    user_query = state.user_query
+    intent = state.intent or IntentType.GENERAL_CHAT
+    context = state.retrieved_context
+    search_results = state.search_results
+    
+    if intent in _GENERIC_INTENTS and not context and not search_results:
+        # Nothing to add to the query, use the prebuilt system message
+        messages = [_GENERIC_SYSTEM_MSG, {"role": "user", "content": user_query}]
+    else:
+        messages = _build_messages(search_service, user_query, intent, context, search_results)
+    
+    writer = _get_writer()
+    
+    # Web results are time-sensitive, so only answers without them are cached
+    key = None
+    if not search_results:
+        key = _response_cache_key(getattr(llm, "model_name", ""), messages)
+        response = _RESPONSE_CACHE.get(key)
+        if response is None:
+            response = await _await_inflight_response(key)
+        if response is not None:
+            logger.info("Response served from cache")
+            writer({"explanation_delta": response})
+            return _response_update(user_query, response)
+        
+        inflight = asyncio.get_running_loop().create_future()
+        _RESPONSE_INFLIGHT[key] = inflight
+    
+    try:
+        # Stream response, emitting each chunk to graph stream consumers
+        chunks = []
+        async for chunk in llm.generate_stream(messages):
+            chunks.append(chunk)
+            writer({"explanation_delta": chunk})
+        response = "".join(chunks)
+        
+        if key is not None:
+            _RESPONSE_CACHE[key] = response
+            inflight.set_result(response)
+        
+    finally:
+        if key is not None:
+            if _RESPONSE_INFLIGHT.get(key) is inflight:
+                del _RESPONSE_INFLIGHT[key]
+            if not inflight.done():
+                # Waiters fall back to generating the response themselves
+                inflight.cancel()
+    
+    logger.info("Response generated successfully")
+    
+    return _response_update(user_query, response)
 
-    async def generate_response(self, state: AgentState) -> Dict:
-        """Generate the final response to the user.
+
+async def _await_inflight_response(key: bytes) -> Optional[str]:
+    """Wait for an identical response that is already being generated.
+    
+    Args:
+        key: Response cache key
         
-        This node uses the LLM to generate a response based on the
-        user query, intent, and retrieved context.
+    Returns:
+        Optional[str]: The shared response, or None if there is none in
+            flight or its generation failed
+    """
+    inflight = _RESPONSE_INFLIGHT.get(key)
+    if inflight is None:
+        return None
+    
+    # wait() does not propagate the generating request's failure
+    await asyncio.wait((inflight,))
+    if inflight.cancelled():
+        return None
+    return inflight.result()
+
+
+def _response_update(user_query: str, response: str) -> Dict:
+    """Build the state update for a generated response.
+    
+    Args:
+        user_query: Current user query
+        response: Generated response
         
-        Args:
-            state: Current agent state
-            
-        Returns:
-            Dict: Updated state with generated response
-        """
-        logger.info("Generating response")
-        
-        user_query = state["user_query"]
-        intent = state.get("intent", IntentType.GENERAL_CHAT)
-        context = state.get("retrieved_context", [])
-        search_results = state.get("search_results")
-        
-        # Build response prompt based on intent
-        if intent == IntentType.CODE_GENERATION:
-            system_prompt = "You are an expert programmer. Generate clean, well-documented code based on the user's request."
-        elif intent == IntentType.CODE_EXPLANATION:
-            system_prompt = "You are an expert programmer. Explain code clearly and concisely."
-        elif intent == IntentType.CODE_DEBUG:
-            system_prompt = "You are an expert debugger. Help identify and fix issues in code."
-        elif intent == IntentType.CODE_REFACTOR:
-            system_prompt = "You are an expert in code quality. Suggest improvements and refactorings."
-        elif intent == IntentType.WEB_SEARCH:
-            system_prompt = "You are a helpful assistant with access to current web information. Provide accurate, up-to-date answers based on the search results."
-        else:
-            system_prompt = "You are a helpful programming assistant."
-        
-        # Add context if available
-        context_text = ""
-        if context:
-            context_text = "\n\nRelevant code context:\n" + "\n\n".join(
-                [f"```\n{chunk.get('content', '')}\n```" for chunk in context]
-            )
-        
-        # Add search results if available
-        if search_results and self.search_service:
-            search_context = self.search_service.format_results_for_context(search_results)
-            context_text += f"\n\n{search_context}"
-        
-        # Build messages
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_query + context_text},
-        ]
-        
-        # Generate response
-        response = await self.llm.generate(messages)
-        
-        logger.info("Response generated successfully")
-        
-        # Update messages history
-        updated_messages = state.get("messages", [])
-        updated_messages.append(HumanMessage(content=user_query))
-        updated_messages.append(AIMessage(content=response))
+    Returns:
+        Dict: State update with the explanation and the new turn
+    """
+    # Only the new turn is returned; the state reducer appends it
+    return {
+        "explanation": response,
+        "messages": [
+            HumanMessage(content=user_query),
+            AIMessage(content=response),
+        ],
+    }
+
+
+def _response_cache_key(model_id: str, messages: List[Dict[str, str]]) -> bytes:
+    """Build the response cache key for a prompt.
+    
+    Args:
+        model_id: Identifier of the generating model
+        messages: Final messages sent to the LLM
         
-        return {
-            "explanation": response,
-            "messages": updated_messages,
-        }
+    Returns:
+        bytes: Digest of the cache version, model and message contents
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{_RESPONSE_CACHE_VERSION}\0{model_id}".encode())
+    for message in messages:
+        digest.update(f"\0{message['role']}\0{message['content']}".encode())
+    return digest.digest()
 
-    async def handle_error(self, state: AgentState) -> Dict:
-        """Handle errors that occur during agent execution.
+
+def _get_writer() -> Callable[[Dict], None]:
+    """Get the graph stream writer for the current run.
+    
+    Returns:
+        Callable[[Dict], None]: Stream writer, or a no-op when the node
+            is called outside a graph run (e.g. through AgentNodes)
+    """
+    try:
+        return get_stream_writer()
+    except RuntimeError:
+        return _discard_stream_chunk
+
+
+def _discard_stream_chunk(chunk: Dict) -> None:
+    """Stream writer used outside a graph run."""
+
+
+def _build_messages(
+    search_service: Optional["TavilySearchService"],
+    user_query: str,
+    intent: str,
+    context: List[Dict],
+    search_results: Optional[Dict],
+) -> List[Dict[str, str]]:
+    """Build the response prompt for an intent with optional context.
+    
+    Args:
+        search_service: Optional Tavily search service for formatting results
+        user_query: Current user query
+        intent: Classified intent
+        context: Retrieved code chunks
+        search_results: Optional web search results
+        
+    Returns:
+        List[Dict[str, str]]: Messages for the LLM
+    """
+    # Build response prompt based on intent
+    system_prompt = _SYSTEM_PROMPTS.get(intent, _DEFAULT_SYSTEM_PROMPT)
+    
+    # Add context if available
+    context_text = ""
+    if context:
+        # Chunks without content would only add empty fences to the prompt
+        context_text = _CONTEXT_HEADER + "".join(
+            _FENCE_OPEN + chunk["content"] + _FENCE_CLOSE
+            for chunk in context
+            if chunk.get("content")
+        )
+    
+    # Add search results if available
+    if search_results and search_service:
+        search_context = search_service.format_results_for_context(search_results)
+        context_text += f"\n\n{search_context}"
+    
+    # Build messages
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_query + context_text},
+    ]
+    
+    return messages
+
+
+async def handle_error(state: AgentState) -> Dict:
+    """Handle errors that occur during agent execution.
+    
+    This node generates a user-friendly error message when
+    something goes wrong.
+    
+    Args:
+        state: Current agent state
         
-        This node generates a user-friendly error message when
-        something goes wrong.
+    Returns:
+        Dict: Updated state with error message
+    """
+    logger.error("Handling agent error", error=state.error)
+    
+    # A fresh message per error: add_messages assigns message IDs in place,
+    # so a shared instance would replace earlier errors in the history
+    return {
+        "explanation": _ERROR_TEXT,
+        "messages": [AIMessage(content=_ERROR_TEXT)],
+    }
+
+
+class AgentNodes:
+    """Collection of agent node functions.
+    
+    Thin facade over the module-level node functions that binds the LLM
+    provider and search service. The graph wires the functions directly
+    with functools.partial.
+    """
+
+    def __init__(
+        self,
+        llm_provider: LLMProvider,
+        search_service: Optional["TavilySearchService"] = None,
+    ):
+        """Initialize agent nodes with LLM provider and search service.
         
         Args:
-            state: Current agent state
-            
-        Returns:
-            Dict: Updated state with error message
+            llm_provider: LLM provider for generating responses
+            search_service: Optional Tavily search service for web searches
         """
-        logger.error("Handling agent error", error=state.get("error"))
-        
-        error_message = "I encountered an error while processing your request. Please try again or rephrase your question."
-        
-        updated_messages = state.get("messages", [])
-        updated_messages.append(AIMessage(content=error_message))
-        
-        return {
-            "explanation": error_message,
-            "messages": updated_messages,
-        }
+        self.llm = llm_provider
+        self.search_service = search_service
+
+    async def classify_intent(self, state: AgentState) -> Dict:
+        """Classify the user's intent."""
+        return await classify_intent(self.llm, state)
+
+    @staticmethod
+    def invalidate_intent_cache() -> None:
+        """Drop all cached intent classifications."""
+        invalidate_intent_cache()
+
+    async def classify_and_maybe_retrieve(self, state: AgentState) -> Dict:
+        """Classify intent while speculatively retrieving context and searching."""
+        return await classify_and_maybe_retrieve(self.llm, self.search_service, state)
+
+    async def retrieve_context(self, state: AgentState) -> Dict:
+        """Retrieve relevant code context from vector store."""
+        return await retrieve_context(state)
+
+    async def web_search(self, state: AgentState) -> Dict:
+        """Perform web search using Tavily."""
+        return await web_search(self.search_service, state)
+
+    async def generate_response(self, state: AgentState) -> Dict:
+        """Generate the final response to the user."""
+        return await generate_response(self.llm, self.search_service, state)
+
+    async def handle_error(self, state: AgentState) -> Dict:
+        """Handle errors that occur during agent execution."""
+        return await handle_error(state)
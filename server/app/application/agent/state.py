@@ -4,64 +4,72 @@ This module defines the state structure for the ByteBuddhi LangGraph agent.
 The state tracks conversation context, retrieved code, and agent decisions.
 """
 
-from typing import Any, Dict, List, Optional, TypedDict
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 
 from langchain_core.messages import BaseMessage
+from langgraph.graph.message import add_messages
 
 
-class AgentState(TypedDict):
+@dataclass(slots=True)
+class AgentState:
     """State for the ByteBuddhi coding agent.
     
-    This TypedDict defines all state variables that are passed between
-    agent nodes during execution. The state accumulates information
-    as the agent processes the user's request.
+    This slotted dataclass defines all state variables that are passed
+    between agent nodes during execution. The state accumulates information
+    as the agent processes the user's request. Nodes read fields as
+    attributes and return partial dict updates.
     
     Attributes:
-        messages: Conversation history (user and assistant messages)
+        messages: Conversation history (user and assistant messages).
+            Nodes return only new messages; the reducer appends them.
         user_query: Current user query/request
         intent: Classified intent (e.g., 'code_generation', 'explanation', 'debug')
         project_id: ID of the project being worked on
         retrieved_context: Code chunks retrieved from vector store
+        search_results: Web search results
         generated_code: Code generated by the agent
         explanation: Explanation or response text
         error: Error message if something went wrong
         metadata: Additional metadata for the interaction
     """
     
-    # Conversation history
-    messages: List[BaseMessage]
-    
     # Current request
-    user_query: str
+    user_query: str = ""
+    
+    # Conversation history
+    messages: Annotated[List[BaseMessage], add_messages] = field(default_factory=list)
     
     # Intent classification
-    intent: Optional[str]
+    intent: Optional[str] = None
     
     # Project context
-    project_id: Optional[str]
+    project_id: Optional[str] = None
     
     # Retrieved code context
-    retrieved_context: List[Dict[str, Any]]
+    retrieved_context: List[Dict[str, Any]] = field(default_factory=list)
     
     # Web search results
-    search_results: Optional[Dict[str, Any]]
+    search_results: Optional[Dict[str, Any]] = None
     
     # Generated outputs
-    generated_code: Optional[str]
-    explanation: Optional[str]
+    generated_code: Optional[str] = None
+    explanation: Optional[str] = None
     
     # Error handling
-    error: Optional[str]
+    error: Optional[str] = None
     
     # Additional metadata
-    metadata: Dict[str, Any]
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-class IntentType:
+class IntentType(StrEnum):
     """Intent types for agent classification.
     
-    These constants define the different types of user intents
-    the agent can handle.
+    These members define the different types of user intents
+    the agent can handle. Members are strings, so they compare
+    equal to the raw intent values.
     """
     
     CODE_GENERATION = "code_generation"
@@ -73,18 +81,13 @@ class IntentType:
     GENERAL_CHAT = "general_chat"
     
     @classmethod
-    def all_intents(cls) -> List[str]:
+    def all_intents(cls) -> Tuple[str, ...]:
         """Get all available intent types.
         
         Returns:
-            List[str]: List of all intent type strings
+            Tuple[str, ...]: All intent type strings, in definition order
         """
-        return [
-            cls.CODE_GENERATION,
-            cls.CODE_EXPLANATION,
-            cls.CODE_DEBUG,
-            cls.CODE_REFACTOR,
-            cls.QUESTION_ANSWER,
-            cls.WEB_SEARCH,
-            cls.GENERAL_CHAT,
-        ]
+        return _ALL_INTENTS
+
+
+_ALL_INTENTS: Tuple[str, ...] = tuple(intent.value for intent in IntentType)
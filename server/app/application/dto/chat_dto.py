@@ -2,12 +2,14 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class CreateConversationDTO(BaseModel):
     """DTO for creating a conversation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     user_id: UUID
     project_id: Optional[UUID] = None
     title: Optional[str] = None
@@ -16,6 +18,8 @@ class CreateConversationDTO(BaseModel):
 class SendMessageDTO(BaseModel):
     """DTO for sending a message."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     conversation_id: UUID
     content: str
     role: str = "user"
@@ -25,6 +29,8 @@ class SendMessageDTO(BaseModel):
 class ConversationResponseDTO(BaseModel):
     """DTO for conversation response."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
     id: UUID
     user_id: UUID
     project_id: Optional[UUID]
@@ -33,20 +39,16 @@ class ConversationResponseDTO(BaseModel):
     updated_at: datetime
     is_archived: bool
 
-    class Config:
-        from_attributes = True
-
 
 class MessageResponseDTO(BaseModel):
     """DTO for message response."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
     id: UUID
     conversation_id: UUID
     role: str
     content: str
     created_at: datetime
     parent_message_id: Optional[UUID]
-    feedback: Optional[int]
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    feedback: Optional[int]
\ No newline at end of file
@@ -2,12 +2,14 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class CreateProjectDTO(BaseModel):
     """DTO for creating a project."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     user_id: UUID
     name: str
     description: Optional[str] = None
@@ -20,6 +22,8 @@ class CreateProjectDTO(BaseModel):
 class UpdateProjectDTO(BaseModel):
     """DTO for updating a project."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: Optional[str] = None
     description: Optional[str] = None
     language: Optional[str] = None
@@ -29,6 +33,8 @@ class UpdateProjectDTO(BaseModel):
 class ProjectResponseDTO(BaseModel):
     """DTO for project response."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
     id: UUID
     user_id: UUID
     name: str
@@ -40,7 +46,4 @@ class ProjectResponseDTO(BaseModel):
     created_at: datetime
     updated_at: datetime
     last_indexed_at: Optional[datetime]
-    is_active: bool
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    is_active: bool
\ No newline at end of file
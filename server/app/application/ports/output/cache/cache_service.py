@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 
 class CacheService(ABC):
@@ -15,6 +15,16 @@ class CacheService(ABC):
         """Set value in cache with optional TTL (seconds)."""
         pass
 
+    @abstractmethod
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple values from cache in one round-trip."""
+        pass
+
+    @abstractmethod
+    async def mset(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set multiple values in cache in one round-trip with optional TTL (seconds)."""
+        pass
+
     @abstractmethod
     async def delete(self, key: str) -> bool:
         """Delete value from cache."""
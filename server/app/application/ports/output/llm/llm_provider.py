@@ -17,7 +17,16 @@ class LLMProvider(ABC):
         pass
 
     @abstractmethod
-    async def stream(
+    async def generate_classification(
+        self,
+        messages: List[Dict[str, str]],
+        labels: List[str],
+    ) -> str:
+        """Classify the conversation into exactly one of the given labels."""
+        pass
+
+    @abstractmethod
+    async def generate_stream(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
@@ -34,5 +43,9 @@ class LLMProvider(ABC):
 
     @abstractmethod
     async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
-        """Get embeddings for multiple texts."""
+        """Get embeddings for multiple texts.
+
+        Use this rather than repeated get_embedding() calls whenever
+        more than one text needs embedding.
+        """
         pass
\ No newline at end of file
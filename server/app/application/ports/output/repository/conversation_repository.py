@@ -3,6 +3,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from app.domain.models.conversation import Conversation
+from app.domain.models.message import Message
 
 
 class ConversationRepository(ABC):
@@ -30,6 +31,14 @@ class ConversationRepository(ABC):
         """Update conversation."""
         pass
 
+    @abstractmethod
+    async def append_message_atomic(self, message: Message) -> Optional[Message]:
+        """Insert a message and bump its conversation's updated_at in one round-trip.
+
+        Returns None, without inserting, if the conversation does not exist.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, conversation_id: UUID) -> bool:
         """Delete conversation."""
@@ -26,8 +26,8 @@ class CreateConversationUseCase:
         # Save to repository
         saved_conversation = await self.conversation_repository.create(conversation)
 
-        # Return DTO
-        return ConversationResponseDTO(
+        # Return DTO, skipping validation: fields come from a saved domain model
+        return ConversationResponseDTO.model_construct(
             id=saved_conversation.id,
             user_id=saved_conversation.user_id,
             project_id=saved_conversation.project_id,
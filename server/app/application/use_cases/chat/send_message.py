@@ -2,7 +2,6 @@ from app.application.dto.chat_dto import MessageResponseDTO, SendMessageDTO
 from app.application.ports.output.repository.conversation_repository import (
     ConversationRepository,
 )
-from app.application.ports.output.repository.message_repository import MessageRepository
 from app.domain.exceptions.conversation_exceptions import ConversationNotFoundException
 from app.domain.models.message import Message
 
@@ -10,21 +9,11 @@ from app.domain.models.message import Message
 class SendMessageUseCase:
     """Use case for sending a message."""
 
-    def __init__(
-        self,
-        message_repository: MessageRepository,
-        conversation_repository: ConversationRepository,
-    ):
-        self.message_repository = message_repository
+    def __init__(self, conversation_repository: ConversationRepository):
         self.conversation_repository = conversation_repository
 
     async def execute(self, dto: SendMessageDTO) -> MessageResponseDTO:
         """Execute the use case."""
-        # Verify conversation exists
-        conversation = await self.conversation_repository.get_by_id(dto.conversation_id)
-        if not conversation:
-            raise ConversationNotFoundException(str(dto.conversation_id))
-
         # Create message
         message = Message.create(
             conversation_id=dto.conversation_id,
@@ -33,15 +22,13 @@ class SendMessageUseCase:
             parent_message_id=dto.parent_message_id,
         )
 
-        # Save message
-        saved_message = await self.message_repository.create(message)
-
-        # Update conversation timestamp
-        conversation.updated_at = saved_message.created_at
-        await self.conversation_repository.update(conversation)
+        # Save message and update conversation timestamp in one round-trip
+        saved_message = await self.conversation_repository.append_message_atomic(message)
+        if saved_message is None:
+            raise ConversationNotFoundException(str(dto.conversation_id))
 
-        # Return DTO
-        return MessageResponseDTO(
+        # Return DTO, skipping validation: fields come from a saved domain model
+        return MessageResponseDTO.model_construct(
             id=saved_message.id,
             conversation_id=saved_message.conversation_id,
             role=saved_message.role,
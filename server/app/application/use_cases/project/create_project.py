@@ -30,8 +30,8 @@ class CreateProjectUseCase:
         # Save to repository
         saved_project = await self.project_repository.create(project)
 
-        # Return DTO
-        return ProjectResponseDTO(
+        # Return DTO, skipping validation: fields come from a saved domain model
+        return ProjectResponseDTO.model_construct(
             id=saved_project.id,
             user_id=saved_project.user_id,
             name=saved_project.name,
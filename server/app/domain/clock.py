@@ -0,0 +1,18 @@
+"""Domain clock.
+
+Timestamps are stored as naive UTC datetimes, matching the database's
+timestamp-without-time-zone columns.
+"""
+
+from datetime import UTC, datetime
+
+
+def utcnow() -> datetime:
+    """Get the current UTC time as a naive datetime.
+    
+    Replaces the deprecated datetime.utcnow().
+    
+    Returns:
+        datetime: Current UTC time without tzinfo
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
@@ -0,0 +1,6 @@
+"""Metadata helpers shared by domain models."""
+
+from types import MappingProxyType
+
+# Shared read-only metadata for instances created without any
+EMPTY_METADATA = MappingProxyType({})
@@ -1,11 +1,29 @@
 from datetime import datetime
-from typing import Optional
-from uuid import UUID, uuid4
+from typing import Iterable, List, Optional
+from uuid import UUID
+
+from uuid_utils.compat import uuid4
+
+from app.domain.clock import utcnow
+from app.domain.models._metadata import EMPTY_METADATA
 
 
 class CodeChunk:
     """Domain model for Code Chunk entity."""
 
+    __slots__ = (
+        "id",
+        "file_id",
+        "project_id",
+        "chunk_text",
+        "chunk_index",
+        "start_line",
+        "end_line",
+        "created_at",
+        "updated_at",
+        "metadata",
+    )
+
     def __init__(
         self,
         id: UUID,
@@ -28,7 +46,7 @@ class CodeChunk:
         self.end_line = end_line
         self.created_at = created_at
         self.updated_at = updated_at
-        self.metadata = metadata or {}
+        self.metadata = metadata if metadata else EMPTY_METADATA
 
     @staticmethod
     def create(
@@ -39,9 +57,13 @@ class CodeChunk:
         start_line: int,
         end_line: int,
         metadata: Optional[dict] = None,
+        now: Optional[datetime] = None,
     ) -> "CodeChunk":
-        """Factory method to create a new code chunk."""
-        now = datetime.utcnow()
+        """Factory method to create a new code chunk.
+        
+        Pass now to share one timestamp across chunks created together.
+        """
+        now = now or utcnow()
         return CodeChunk(
             id=uuid4(),
             file_id=file_id,
@@ -54,3 +76,26 @@ class CodeChunk:
             updated_at=now,
             metadata=metadata,
         )
+
+    @staticmethod
+    def create_batch(rows: Iterable[dict]) -> List["CodeChunk"]:
+        """Factory method to create many code chunks sharing one timestamp.
+        
+        Each row holds the keyword arguments accepted by create().
+        """
+        now = utcnow()
+        return [
+            CodeChunk(
+                id=uuid4(),
+                file_id=row["file_id"],
+                project_id=row["project_id"],
+                chunk_text=row["chunk_text"],
+                chunk_index=row["chunk_index"],
+                start_line=row["start_line"],
+                end_line=row["end_line"],
+                created_at=now,
+                updated_at=now,
+                metadata=row.get("metadata"),
+            )
+            for row in rows
+        ]
@@ -1,11 +1,27 @@
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from uuid_utils.compat import uuid4
+
+from app.domain.clock import utcnow
+from app.domain.models._metadata import EMPTY_METADATA
 
 
 class Conversation:
     """Domain model for Conversation entity."""
 
+    __slots__ = (
+        "id",
+        "user_id",
+        "project_id",
+        "title",
+        "created_at",
+        "updated_at",
+        "is_archived",
+        "metadata",
+    )
+
     def __init__(
         self,
         id: UUID,
@@ -24,7 +40,7 @@ class Conversation:
         self.created_at = created_at
         self.updated_at = updated_at
         self.is_archived = is_archived
-        self.metadata = metadata or {}
+        self.metadata = metadata if metadata else EMPTY_METADATA
 
     @staticmethod
     def create(
@@ -33,7 +49,7 @@ class Conversation:
         title: Optional[str] = None,
     ) -> "Conversation":
         """Factory method to create a new conversation."""
-        now = datetime.utcnow()
+        now = utcnow()
         return Conversation(
             id=uuid4(),
             user_id=user_id,
@@ -47,9 +63,9 @@ class Conversation:
     def archive(self) -> None:
         """Archive the conversation."""
         self.is_archived = True
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utcnow()
 
     def update_title(self, title: str) -> None:
         """Update conversation title."""
         self.title = title
-        self.updated_at = datetime.utcnow()
\ No newline at end of file
+        self.updated_at = utcnow()
\ No newline at end of file
@@ -1,17 +1,37 @@
 from datetime import datetime
-from typing import List, Optional
-from uuid import UUID, uuid4
+from typing import Optional, Sequence, Union
+from uuid import UUID
+
+import numpy as np
+from uuid_utils.compat import uuid4
+
+from app.domain.clock import utcnow
+from app.domain.models._metadata import EMPTY_METADATA
 
 
 class Embedding:
-    """Domain model for Embedding entity."""
+    """Domain model for Embedding entity.
+
+    The vector is held as a contiguous float32 array, which is what pgvector
+    stores and roughly an eighth of the size of a list of Python floats.
+    """
+
+    __slots__ = (
+        "id",
+        "code_chunk_id",
+        "project_id",
+        "embedding_vector",
+        "model_name",
+        "created_at",
+        "metadata",
+    )
 
     def __init__(
         self,
         id: UUID,
         code_chunk_id: UUID,
         project_id: UUID,
-        embedding_vector: List[float],
+        embedding_vector: Union[np.ndarray, Sequence[float]],
         model_name: str,
         created_at: datetime,
         metadata: Optional[dict] = None,
@@ -19,20 +39,20 @@ class Embedding:
         self.id = id
         self.code_chunk_id = code_chunk_id
         self.project_id = project_id
-        self.embedding_vector = embedding_vector
+        self.embedding_vector = np.ascontiguousarray(embedding_vector, dtype=np.float32)
         self.model_name = model_name
         self.created_at = created_at
-        self.metadata = metadata or {}
+        self.metadata = metadata if metadata else EMPTY_METADATA
 
         # Validate embedding dimension
-        if len(embedding_vector) == 0:
+        if self.embedding_vector.size == 0:
             raise ValueError("Embedding vector cannot be empty")
 
     @staticmethod
     def create(
         code_chunk_id: UUID,
         project_id: UUID,
-        embedding_vector: List[float],
+        embedding_vector: Union[np.ndarray, Sequence[float]],
         model_name: str,
         metadata: Optional[dict] = None,
     ) -> "Embedding":
@@ -43,6 +63,6 @@ class Embedding:
             project_id=project_id,
             embedding_vector=embedding_vector,
             model_name=model_name,
-            created_at=datetime.utcnow(),
+            created_at=utcnow(),
             metadata=metadata,
         )
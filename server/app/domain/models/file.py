@@ -1,11 +1,29 @@
+import sys
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from uuid_utils.compat import uuid4
+
+from app.domain.clock import utcnow
 
 
 class File:
     """Domain model for File entity."""
 
+    __slots__ = (
+        "id",
+        "project_id",
+        "file_path",
+        "file_name",
+        "file_type",
+        "size_bytes",
+        "content_hash",
+        "last_modified",
+        "created_at",
+        "is_deleted",
+    )
+
     def __init__(
         self,
         id: UUID,
@@ -23,7 +41,7 @@ class File:
         self.project_id = project_id
         self.file_path = file_path
         self.file_name = file_name
-        self.file_type = file_type
+        self.file_type = sys.intern(file_type)
         self.size_bytes = size_bytes
         self.content_hash = content_hash
         self.last_modified = last_modified
@@ -41,7 +59,7 @@ class File:
         last_modified: Optional[datetime] = None,
     ) -> "File":
         """Factory method to create a new file."""
-        now = datetime.utcnow()
+        now = utcnow()
         return File(
             id=uuid4(),
             project_id=project_id,
@@ -63,4 +81,4 @@ class File:
         """Update file content metadata."""
         self.content_hash = content_hash
         self.size_bytes = size_bytes
-        self.last_modified = datetime.utcnow()
+        self.last_modified = utcnow()
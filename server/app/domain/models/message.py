@@ -1,11 +1,31 @@
+import sys
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from uuid_utils.compat import uuid4
+
+from app.domain.clock import utcnow
+from app.domain.models._metadata import EMPTY_METADATA
+
+# Valid roles, interned so every message shares one string per role
+_ROLES = {role: sys.intern(role) for role in ("user", "assistant", "system", "tool")}
 
 
 class Message:
     """Domain model for Message entity."""
 
+    __slots__ = (
+        "id",
+        "conversation_id",
+        "role",
+        "content",
+        "created_at",
+        "metadata",
+        "parent_message_id",
+        "feedback",
+    )
+
     def __init__(
         self,
         id: UUID,
@@ -17,19 +37,20 @@ class Message:
         parent_message_id: Optional[UUID] = None,
         feedback: Optional[int] = None,
     ):
+        # Validate role
+        interned_role = _ROLES.get(role)
+        if interned_role is None:
+            raise ValueError(f"Invalid role: {role}")
+        
         self.id = id
         self.conversation_id = conversation_id
-        self.role = role
+        self.role = interned_role
         self.content = content
         self.created_at = created_at
-        self.metadata = metadata or {}
+        self.metadata = metadata if metadata else EMPTY_METADATA
         self.parent_message_id = parent_message_id
         self.feedback = feedback
 
-        # Validate role
-        if role not in ["user", "assistant", "system", "tool"]:
-            raise ValueError(f"Invalid role: {role}")
-
     @staticmethod
     def create(
         conversation_id: UUID,
@@ -44,13 +65,13 @@ class Message:
             conversation_id=conversation_id,
             role=role,
             content=content,
-            created_at=datetime.utcnow(),
+            created_at=utcnow(),
             metadata=metadata,
             parent_message_id=parent_message_id,
         )
 
     def add_feedback(self, feedback: int) -> None:
         """Add user feedback to the message."""
-        if feedback not in [-1, 1]:
+        if feedback not in {-1, 1}:
             raise ValueError("Feedback must be -1 or 1")
         self.feedback = feedback
\ No newline at end of file
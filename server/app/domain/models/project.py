@@ -1,11 +1,31 @@
+import sys
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from uuid_utils.compat import uuid4
+
+from app.domain.clock import utcnow
 
 
 class Project:
     """Domain model for Project entity."""
 
+    __slots__ = (
+        "id",
+        "user_id",
+        "name",
+        "description",
+        "repository_url",
+        "local_path",
+        "language",
+        "framework",
+        "created_at",
+        "updated_at",
+        "last_indexed_at",
+        "is_active",
+    )
+
     def __init__(
         self,
         id: UUID,
@@ -27,8 +47,8 @@ class Project:
         self.description = description
         self.repository_url = repository_url
         self.local_path = local_path
-        self.language = language
-        self.framework = framework
+        self.language = sys.intern(language) if language else language
+        self.framework = sys.intern(framework) if framework else framework
         self.created_at = created_at
         self.updated_at = updated_at
         self.last_indexed_at = last_indexed_at
@@ -45,7 +65,7 @@ class Project:
         framework: Optional[str] = None,
     ) -> "Project":
         """Factory method to create a new project."""
-        now = datetime.utcnow()
+        now = utcnow()
         return Project(
             id=uuid4(),
             user_id=user_id,
@@ -63,8 +83,8 @@ class Project:
 
     def mark_as_indexed(self) -> None:
         """Mark the project as indexed."""
-        self.last_indexed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.last_indexed_at = utcnow()
+        self.updated_at = utcnow()
 
     def update_info(
         self,
@@ -79,7 +99,7 @@ class Project:
         if description:
             self.description = description
         if language:
-            self.language = language
+            self.language = sys.intern(language)
         if framework:
-            self.framework = framework
-        self.updated_at = datetime.utcnow()
\ No newline at end of file
+            self.framework = sys.intern(framework)
+        self.updated_at = utcnow()
\ No newline at end of file
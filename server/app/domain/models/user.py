@@ -1,8 +1,13 @@
 """User domain model."""
 
+import secrets
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from uuid_utils.compat import uuid4
+
+from app.domain.clock import utcnow
 
 
 class User:
@@ -12,6 +17,18 @@ class User:
     quota management, and API access capabilities.
     """
 
+    __slots__ = (
+        "id",
+        "email",
+        "username",
+        "password_hash",
+        "created_at",
+        "updated_at",
+        "is_active",
+        "api_key",
+        "usage_quota",
+    )
+
     def __init__(
         self,
         id: UUID,
@@ -65,7 +82,7 @@ class User:
         Returns:
             User: New user instance
         """
-        now = datetime.utcnow()
+        now = utcnow()
         return User(
             id=uuid4(),
             email=email,
@@ -81,12 +98,12 @@ class User:
     def deactivate(self) -> None:
         """Deactivate the user account."""
         self.is_active = False
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utcnow()
 
     def activate(self) -> None:
         """Activate the user account."""
         self.is_active = True
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utcnow()
 
     def update_quota(self, new_quota: int) -> None:
         """Update the user's usage quota.
@@ -95,7 +112,16 @@ class User:
             new_quota: New quota limit
         """
         self.usage_quota = new_quota
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utcnow()
+
+    @staticmethod
+    def generate_api_key() -> str:
+        """Generate a new random API key.
+        
+        Returns:
+            str: URL-safe key carrying 256 bits of entropy
+        """
+        return secrets.token_urlsafe(32)
 
     def update_api_key(self, new_api_key: str) -> None:
         """Update the user's API key.
@@ -104,7 +130,7 @@ class User:
             new_api_key: New API key
         """
         self.api_key = new_api_key
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utcnow()
 
     def update_password(self, new_password_hash: str) -> None:
         """Update the user's password hash.
@@ -113,4 +139,4 @@ class User:
             new_password_hash: New bcrypt password hash
         """
         self.password_hash = new_password_hash
-        self.updated_at = datetime.utcnow()
\ No newline at end of file
+        self.updated_at = utcnow()
\ No newline at end of file
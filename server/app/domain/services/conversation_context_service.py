@@ -21,29 +21,34 @@ class ConversationContextService:
     def select_messages_for_context(
         messages: List[Message],
         max_tokens: int = 4000,
-        avg_tokens_per_message: int = 200,
     ) -> List[Message]:
         """Select messages to include in context window.
         
         Business rule: Keep most recent messages that fit within
-        the token limit, always including the last user message.
+        the token limit, always including the last message.
         
         Args:
             messages: All messages in conversation
             max_tokens: Maximum tokens for context
-            avg_tokens_per_message: Average tokens per message
             
         Returns:
             List[Message]: Messages to include in context
         """
-        max_messages = max_tokens // avg_tokens_per_message
+        # Walk back from the newest message until the budget is exhausted
+        total = 0
+        cutoff = 0
+        for i in range(len(messages) - 1, -1, -1):
+            total += len(messages[i].content) >> 2
+            if total > max_tokens:
+                cutoff = i + 1
+                break
         
         # Always include at least the last message
-        if len(messages) <= max_messages:
+        cutoff = min(cutoff, len(messages) - 1)
+        if cutoff <= 0:
             return messages
         
-        # Take most recent messages
-        return messages[-max_messages:]
+        return messages[cutoff:]
 
     @staticmethod
     def should_summarize_conversation(
@@ -81,20 +86,40 @@ class ConversationContextService:
         Returns:
             float: Relevance score (0.0 to 1.0)
         """
-        # Simple keyword-based relevance
-        # In production, use embeddings for better relevance
+        return ConversationContextService.score_messages_batch([message], current_query)[0]
+
+    @staticmethod
+    def score_messages_batch(
+        messages: List[Message],
+        current_query: str,
+    ) -> List[float]:
+        """Calculate relevance scores for many messages against one query.
         
-        query_words = set(current_query.lower().split())
-        message_words = set(message.content.lower().split())
+        The query is tokenized once and shared across all messages.
         
-        # Calculate word overlap
-        overlap = len(query_words & message_words)
-        total = len(query_words | message_words)
+        Args:
+            messages: Messages to score
+            current_query: Current user query
+            
+        Returns:
+            List[float]: Relevance scores (0.0 to 1.0), in message order
+        """
+        # Simple keyword-based relevance (Jaccard similarity of word sets)
+        # In production, use embeddings for better relevance
+        query_words = frozenset(current_query.lower().split())
+        query_size = len(query_words)
         
-        if total == 0:
-            return 0.0
+        scores = []
+        for message in messages:
+            message_words = set(message.content.lower().split())
+            
+            # |A | B| = |A| + |B| - |A & B|
+            overlap = len(query_words & message_words)
+            total = query_size + len(message_words) - overlap
+            
+            scores.append(overlap / total if total else 0.0)
         
-        return overlap / total
+        return scores
 
     @staticmethod
     def format_messages_for_llm(messages: List[Message]) -> List[dict]:
@@ -109,15 +134,10 @@ class ConversationContextService:
         Returns:
             List[dict]: Formatted messages for LLM
         """
-        formatted = []
-        
-        for message in messages:
-            formatted.append({
-                "role": message.role,
-                "content": message.content,
-            })
-        
-        return formatted
+        return [
+            {"role": message.role, "content": message.content}
+            for message in messages
+        ]
 
     @staticmethod
     def estimate_token_count(text: str) -> int:
@@ -133,7 +153,22 @@ class ConversationContextService:
             int: Estimated token count
         """
         # Rough estimation: ~4 characters per token
-        return len(text) // 4
+        return len(text) >> 2
+
+    @staticmethod
+    def estimate_total_tokens(messages: List[Message]) -> int:
+        """Estimate the combined token count of many messages.
+        
+        Uses the same ~4 characters per token rule as estimate_token_count,
+        applied once to the total length.
+        
+        Args:
+            messages: Messages to estimate
+            
+        Returns:
+            int: Estimated token count
+        """
+        return sum(len(message.content) for message in messages) >> 2
 
     @staticmethod
     def prune_old_messages(
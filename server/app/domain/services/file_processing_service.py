@@ -66,19 +66,17 @@ class FileProcessingService:
             logger.warning("No chunks created for file", file_id=str(file_id))
             return {"chunks_created": 0, "embeddings_created": 0}
 
-        # Generate embeddings for each chunk
-        embeddings_created = 0
-        for chunk in chunks:
-            try:
-                embedding = await self._generate_embedding(chunk)
-                if embedding:
-                    embeddings_created += 1
-            except Exception as e:
-                logger.error(
-                    "Failed to generate embedding",
-                    chunk_id=str(chunk.id),
-                    error=str(e),
-                )
+        # Generate embeddings for all chunks in one batched request
+        try:
+            embeddings = await self._generate_embeddings(chunks)
+            embeddings_created = len(embeddings)
+        except Exception as e:
+            logger.error(
+                "Failed to generate embeddings",
+                file_id=str(file_id),
+                error=str(e),
+            )
+            embeddings_created = 0
 
         logger.info(
             "File processing complete",
@@ -152,45 +150,49 @@ class FileProcessingService:
         
         return chunks
 
-    async def _generate_embedding(self, chunk: CodeChunk) -> Embedding:
-        """Generate embedding for a code chunk.
+    async def _generate_embeddings(self, chunks: List[CodeChunk]) -> List[Embedding]:
+        """Generate embeddings for code chunks.
+        
+        All chunk texts are embedded with a single batched provider call.
         
         Args:
-            chunk: Code chunk to embed
+            chunks: Code chunks to embed
             
         Returns:
-            Embedding: Created embedding
+            List[Embedding]: Created embeddings
         """
-        try:
-            # Generate embedding using LLM provider
-            embedding_vector = await self.llm_provider.create_embedding(
-                chunk.chunk_text
-            )
-            
-            # Create embedding domain model
-            embedding = Embedding.create(
-                code_chunk_id=chunk.id,
-                project_id=chunk.project_id,
-                embedding_vector=embedding_vector,
-                model_name=self.llm_provider.model_name,
-                metadata={
-                    "chunk_index": chunk.chunk_index,
-                    "start_line": chunk.start_line,
-                    "end_line": chunk.end_line,
-                }
-            )
-            
-            # Save to database
-            created_embedding = await self.embedding_repo.create(embedding)
-            return created_embedding
-            
-        except Exception as e:
-            logger.error(
-                "Failed to generate embedding",
-                chunk_id=str(chunk.id),
-                error=str(e),
-            )
-            raise
+        # Generate embeddings using LLM provider
+        embedding_vectors = await self.llm_provider.get_embeddings(
+            [chunk.chunk_text for chunk in chunks]
+        )
+        
+        created_embeddings = []
+        for chunk, embedding_vector in zip(chunks, embedding_vectors):
+            try:
+                # Create embedding domain model
+                embedding = Embedding.create(
+                    code_chunk_id=chunk.id,
+                    project_id=chunk.project_id,
+                    embedding_vector=embedding_vector,
+                    model_name=self.llm_provider.model_name,
+                    metadata={
+                        "chunk_index": chunk.chunk_index,
+                        "start_line": chunk.start_line,
+                        "end_line": chunk.end_line,
+                    }
+                )
+                
+                # Save to database
+                created_embeddings.append(await self.embedding_repo.create(embedding))
+                
+            except Exception as e:
+                logger.error(
+                    "Failed to store embedding",
+                    chunk_id=str(chunk.id),
+                    error=str(e),
+                )
+        
+        return created_embeddings
 
     async def search_code(
         self,
@@ -216,7 +218,7 @@ class FileProcessingService:
         )
 
         # Generate embedding for the query
-        query_vector = await self.llm_provider.create_embedding(query)
+        query_vector = await self.llm_provider.get_embedding(query)
         
         # Search for similar embeddings
         results = await self.embedding_repo.search_similar(
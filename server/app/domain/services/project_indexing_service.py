@@ -14,6 +14,33 @@ from app.domain.models.project import Project
 from app.domain.value_objects.file_path import FilePath
 from app.domain.value_objects.language import Language
 
+# Directories whose files are never indexed
+_EXCLUDED_DIRS = frozenset({
+    "node_modules",
+    ".git",
+    ".venv",
+    "venv",
+    "__pycache__",
+    ".pytest_cache",
+    "dist",
+    "build",
+    ".next",
+    "target",
+})
+
+# Language-specific chunk sizes, in lines
+_CHUNK_SIZES = {
+    "python": 50,
+    "javascript": 40,
+    "typescript": 40,
+    "java": 60,
+    "go": 45,
+    "rust": 50,
+    "cpp": 55,
+    "c": 55,
+}
+_DEFAULT_CHUNK_SIZE = 50
+
 
 class ProjectIndexingService:
     """Domain service for project indexing operations.
@@ -47,21 +74,7 @@ class ProjectIndexingService:
             return False
         
         # Exclude common directories
-        excluded_dirs = {
-            "node_modules",
-            ".git",
-            ".venv",
-            "venv",
-            "__pycache__",
-            ".pytest_cache",
-            "dist",
-            "build",
-            ".next",
-            "target",
-        }
-        
-        path_parts = file_path.value.split("/")
-        if any(excluded in path_parts for excluded in excluded_dirs):
+        if not _EXCLUDED_DIRS.isdisjoint(file_path.parts):
             return False
         
         return True
@@ -79,19 +92,7 @@ class ProjectIndexingService:
         Returns:
             int: Optimal chunk size in lines
         """
-        # Language-specific chunk sizes
-        chunk_sizes = {
-            "python": 50,
-            "javascript": 40,
-            "typescript": 40,
-            "java": 60,
-            "go": 45,
-            "rust": 50,
-            "cpp": 55,
-            "c": 55,
-        }
-        
-        return chunk_sizes.get(language.name, 50)
+        return _CHUNK_SIZES.get(language.name, _DEFAULT_CHUNK_SIZE)
 
     @staticmethod
     def create_chunks_from_file(
@@ -112,34 +113,39 @@ class ProjectIndexingService:
         Returns:
             List[CodeChunk]: List of code chunks
         """
-        lines = content.split("\n")
-        chunks = []
+        # Offset of each line start, plus a sentinel one past the end, so
+        # every chunk is a single slice of content
+        line_starts = [0]
+        newline = content.find("\n")
+        while newline != -1:
+            line_starts.append(newline + 1)
+            newline = content.find("\n", newline + 1)
+        num_lines = len(line_starts)
+        line_starts.append(len(content) + 1)
+        
+        rows = []
         overlap = chunk_size // 4  # 25% overlap
         
         chunk_index = 0
         start = 0
         
-        while start < len(lines):
-            end = min(start + chunk_size, len(lines))
-            chunk_text = "\n".join(lines[start:end])
-            
-            # Create chunk
-            chunk = CodeChunk.create(
-                file_id=file.id,
-                project_id=file.project_id,
-                chunk_text=chunk_text,
-                chunk_index=chunk_index,
-                start_line=start + 1,  # 1-indexed
-                end_line=end,
-            )
+        while start < num_lines:
+            end = min(start + chunk_size, num_lines)
             
-            chunks.append(chunk)
+            rows.append({
+                "file_id": file.id,
+                "project_id": file.project_id,
+                "chunk_text": content[line_starts[start]:line_starts[end] - 1],
+                "chunk_index": chunk_index,
+                "start_line": start + 1,  # 1-indexed
+                "end_line": end,
+            })
             
             # Move to next chunk with overlap
-            start = end - overlap if end < len(lines) else end
+            start = end - overlap if end < num_lines else end
             chunk_index += 1
         
-        return chunks
+        return CodeChunk.create_batch(rows)
 
     @staticmethod
     def validate_project_for_indexing(project: Project) -> None:
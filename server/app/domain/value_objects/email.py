@@ -19,8 +19,12 @@ class Email:
         value: The validated email address string
     """
 
-    # Simple email validation pattern
-    EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+    # Simple email validation pattern; the possessive local part cannot
+    # backtrack, since "@" is not in its character class
+    EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]++@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+    
+    # Longest address allowed by RFC 5321, which also bounds matching time
+    MAX_LENGTH = 254
 
     def __init__(self, value: str):
         """Initialize email with validation.
@@ -37,7 +41,7 @@ class Email:
         # Normalize email to lowercase
         normalized = value.strip().lower()
         
-        if not self.EMAIL_PATTERN.match(normalized):
+        if len(normalized) > self.MAX_LENGTH or not self.EMAIL_PATTERN.match(normalized):
             raise ValueError(f"Invalid email format: {value}")
         
         self._value = normalized
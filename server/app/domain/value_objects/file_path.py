@@ -4,8 +4,10 @@ This module provides a value object for file paths with validation.
 Ensures file paths are valid and normalized.
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Tuple
 
 
 class FilePath:
@@ -18,11 +20,15 @@ class FilePath:
         value: The normalized file path string
     """
 
-    def __init__(self, value: str):
+    __slots__ = ("_value", "_path", "_parts", "_extension")
+
+    def __init__(self, value: str, resolve_symlinks: bool = False):
         """Initialize file path with validation.
         
         Args:
             value: File path string
+            resolve_symlinks: Whether to resolve symlinks to a canonical
+                path, which costs filesystem calls per path component
             
         Raises:
             ValueError: If path is empty or invalid
@@ -30,14 +36,39 @@ class FilePath:
         if not value:
             raise ValueError("File path cannot be empty")
         
-        # Normalize path
+        # Normalize path; abspath is pure string work, so only touch the
+        # filesystem when the caller needs symlinks resolved
         try:
-            path = Path(value).resolve()
+            if resolve_symlinks:
+                path = Path(value).resolve()
+            else:
+                path = Path(os.path.abspath(value))
             self._value = str(path)
             self._path = path
+            self._parts = path.parts
+            self._extension = path.suffix
         except Exception as e:
             raise ValueError(f"Invalid file path: {value}") from e
 
+    @classmethod
+    def get(cls, value: str, resolve_symlinks: bool = False) -> "FilePath":
+        """Get a shared FilePath for a path string.
+        
+        FilePath is immutable, so instances are memoized by input string
+        and repeated lookups skip normalization entirely.
+        
+        Args:
+            value: File path string
+            resolve_symlinks: Whether to resolve symlinks to a canonical path
+            
+        Returns:
+            FilePath: The file path value object
+            
+        Raises:
+            ValueError: If path is empty or invalid
+        """
+        return _make_filepath(value, resolve_symlinks)
+
     @property
     def value(self) -> str:
         """Get the file path value.
@@ -93,6 +124,15 @@ class FilePath:
         """
         return hash(self._value)
 
+    @property
+    def parts(self) -> Tuple[str, ...]:
+        """Get path components.
+        
+        Returns:
+            Tuple[str, ...]: Path components, starting with the root
+        """
+        return self._parts
+
     @property
     def name(self) -> str:
         """Get file name.
@@ -109,7 +149,7 @@ class FilePath:
         Returns:
             str: File extension (e.g., '.py')
         """
-        return self._path.suffix
+        return self._extension
 
     @property
     def parent(self) -> str:
@@ -143,3 +183,9 @@ class FilePath:
             bool: True if path is a directory
         """
         return self._path.is_dir()
+
+
+@lru_cache(maxsize=4096)
+def _make_filepath(value: str, resolve_symlinks: bool) -> FilePath:
+    """Build a FilePath, memoized by FilePath.get()."""
+    return FilePath(value, resolve_symlinks)
@@ -32,6 +32,10 @@ class ProgrammingLanguage(str, Enum):
     OTHER = "other"
 
 
+# Language name to enum member, avoiding the enum constructor's miss path
+_LANG_LOOKUP = {member.value: member for member in ProgrammingLanguage}
+
+
 class Language:
     """Programming language value object.
     
@@ -42,6 +46,8 @@ class Language:
         value: The programming language
     """
 
+    __slots__ = ("_value",)
+
     # File extension to language mapping
     EXTENSION_MAP = {
         ".py": ProgrammingLanguage.PYTHON,
@@ -80,12 +86,8 @@ class Language:
         # Normalize to lowercase
         normalized = value.lower().strip()
         
-        # Try to match to enum
-        try:
-            self._value = ProgrammingLanguage(normalized)
-        except ValueError:
-            # Default to OTHER for unknown languages
-            self._value = ProgrammingLanguage.OTHER
+        # Match to enum, defaulting to OTHER for unknown languages
+        self._value = _LANG_LOOKUP.get(normalized, ProgrammingLanguage.OTHER)
 
     @classmethod
     def from_extension(cls, extension: str) -> "Language":
@@ -97,8 +99,12 @@ class Language:
         Returns:
             Language: Language instance
         """
-        lang = cls.EXTENSION_MAP.get(extension.lower(), ProgrammingLanguage.OTHER)
-        return cls(lang.value)
+        # Extensions are almost always lowercase already, so only lower()
+        # (and allocate) on a miss
+        language = _LANGUAGE_BY_EXTENSION.get(extension)
+        if language is None:
+            language = _LANGUAGE_BY_EXTENSION.get(extension.lower(), _OTHER_LANGUAGE)
+        return language
 
     @property
     def value(self) -> ProgrammingLanguage:
@@ -145,7 +151,8 @@ class Language:
         """
         if not isinstance(other, Language):
             return False
-        return self._value == other._value
+        # Enum members are singletons
+        return self._value is other._value
 
     def __hash__(self) -> int:
         """Hash for use in sets and dicts.
@@ -154,3 +161,11 @@ class Language:
             int: Hash value
         """
         return hash(self._value)
+
+
+# Language is immutable, so extension lookups share prebuilt instances
+_LANGUAGE_BY_EXTENSION = {
+    extension: Language(language.value)
+    for extension, language in Language.EXTENSION_MAP.items()
+}
+_OTHER_LANGUAGE = Language(ProgrammingLanguage.OTHER.value)
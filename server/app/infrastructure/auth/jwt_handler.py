@@ -5,17 +5,70 @@ authentication. It supports both access tokens (short-lived) and
 refresh tokens (long-lived).
 """
 
-from datetime import datetime, timedelta
+import base64
+import calendar
+import hashlib
+import hmac
+import re
+import time
+from datetime import datetime
 from typing import Dict, Optional
 from uuid import UUID
 
-from jose import JWTError, jwt
+import orjson
+from cachetools import TTLCache
 
 from app.infrastructure.config.logger import get_logger
 from app.infrastructure.config.settings import settings
 
 logger = get_logger(__name__)
 
+# Successfully verified tokens are trusted for at most this long, and never
+# past their own expiry
+_VERIFIED_TOKEN_TTL_SECONDS = 60
+_VERIFIED_TOKEN_CACHE_SIZE = 8192
+
+# Supported HMAC signing algorithms
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+# Registered claims holding NumericDate values
+_TIME_CLAIMS = ("exp", "iat", "nbf")
+
+# Unpadded base64url alphabet
+_B64URL_SEGMENT = re.compile(rb"[A-Za-z0-9_-]*")
+
+
+class JWTError(Exception):
+    """Raised when a token is malformed, badly signed or expired."""
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWT requires."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Decode unpadded base64url data.
+    
+    urlsafe_b64decode() silently skips characters outside the alphabet
+    and ignores unused trailing bits, so the segment must also be the
+    canonical encoding of its result; otherwise one token would have
+    many accepted spellings.
+    
+    Raises:
+        ValueError: If data is not canonical unpadded base64url
+    """
+    if not _B64URL_SEGMENT.fullmatch(data):
+        raise ValueError("Invalid base64url character")
+    decoded = base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+    if _b64url_encode(decoded) != data:
+        raise ValueError("Non-canonical base64url encoding")
+    return decoded
+
 
 class JWTHandler:
     """JWT token generation and validation.
@@ -29,6 +82,9 @@ class JWTHandler:
         algorithm: JWT signing algorithm
         access_token_expire_minutes: Access token lifetime
         refresh_token_expire_days: Refresh token lifetime
+    
+    Tokens are signed and verified with HMAC directly through hashlib,
+    which is backed by OpenSSL.
     """
 
     def __init__(
@@ -45,6 +101,9 @@ class JWTHandler:
             algorithm: Signing algorithm (defaults to settings)
             access_token_expire_minutes: Access token lifetime (defaults to settings)
             refresh_token_expire_days: Refresh token lifetime (defaults to settings)
+            
+        Raises:
+            ValueError: If the algorithm is not an HMAC algorithm
         """
         self.secret_key = secret_key or settings.jwt_secret_key
         self.algorithm = algorithm or settings.jwt_algorithm
@@ -54,6 +113,26 @@ class JWTHandler:
         self.refresh_token_expire_days = (
             refresh_token_expire_days or settings.refresh_token_expire_days
         )
+        
+        # Lifetimes in seconds, added straight to the epoch for exp
+        self._access_expire_seconds = self.access_token_expire_minutes * 60
+        self._refresh_expire_seconds = self.refresh_token_expire_days * 86400
+        
+        if self.algorithm not in _HMAC_DIGESTS:
+            raise ValueError(f"Unsupported JWT algorithm: {self.algorithm}")
+        # Keyed HMAC state, copied per token instead of re-deriving the pads
+        self._hmac = hmac.new(
+            self.secret_key.encode("utf-8"), digestmod=_HMAC_DIGESTS[self.algorithm]
+        )
+        # The header is the same for every token
+        self._header_segment = _b64url_encode(
+            orjson.dumps({"alg": self.algorithm, "typ": "JWT"})
+        )
+        
+        # (token, token_type) -> (user ID, expiry as a UNIX timestamp)
+        self._verified: TTLCache = TTLCache(
+            maxsize=_VERIFIED_TOKEN_CACHE_SIZE, ttl=_VERIFIED_TOKEN_TTL_SECONDS
+        )
 
     def create_access_token(self, user_id: UUID, additional_claims: Optional[Dict] = None) -> str:
         """Create an access token for a user.
@@ -68,7 +147,7 @@ class JWTHandler:
         Returns:
             str: Encoded JWT access token
         """
-        expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
+        expire = int(time.time()) + self._access_expire_seconds
         
         to_encode = {
             "sub": str(user_id),
@@ -79,8 +158,7 @@ class JWTHandler:
         if additional_claims:
             to_encode.update(additional_claims)
         
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
+        return self._encode(to_encode)
 
     def create_refresh_token(self, user_id: UUID) -> str:
         """Create a refresh token for a user.
@@ -94,7 +172,7 @@ class JWTHandler:
         Returns:
             str: Encoded JWT refresh token
         """
-        expire = datetime.utcnow() + timedelta(days=self.refresh_token_expire_days)
+        expire = int(time.time()) + self._refresh_expire_seconds
         
         to_encode = {
             "sub": str(user_id),
@@ -102,14 +180,15 @@ class JWTHandler:
             "type": "refresh",
         }
         
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
+        return self._encode(to_encode)
 
     def verify_token(self, token: str, token_type: str = "access") -> Optional[UUID]:
         """Verify and decode a JWT token.
         
         Validates the token signature, expiration, and type.
-        Returns the user ID if valid, None otherwise.
+        Returns the user ID if valid, None otherwise. Successful results
+        are cached briefly, so repeat requests with the same token skip
+        signature verification.
         
         Args:
             token: JWT token to verify
@@ -118,8 +197,13 @@ class JWTHandler:
         Returns:
             Optional[UUID]: User ID if token is valid, None otherwise
         """
+        key = (token, token_type)
+        cached = self._verified.get(key)
+        if cached is not None and cached[1] > time.time():
+            return cached[0]
+        
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = self._decode(token)
             
             # Check token type
             if payload.get("type") != token_type:
@@ -132,7 +216,11 @@ class JWTHandler:
                 logger.warning("Token missing subject claim")
                 return None
             
-            return UUID(user_id_str)
+            user_id = UUID(user_id_str)
+            expires_at = payload.get("exp")
+            if expires_at is not None:
+                self._verified[key] = (user_id, float(expires_at))
+            return user_id
             
         except JWTError as e:
             logger.warning("JWT verification failed", error=str(e))
@@ -154,17 +242,89 @@ class JWTHandler:
             Optional[Dict]: Token payload if decodable, None otherwise
         """
         try:
-            payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=[self.algorithm],
-                options={"verify_signature": False}
-            )
-            return payload
+            return self._decode(token, verify=False)
         except JWTError as e:
             logger.error("Token decoding failed", error=str(e))
             return None
 
+    def _encode(self, claims: Dict) -> str:
+        """Sign claims into a compact JWT.
+        
+        datetime values of the registered time claims are converted to
+        NumericDate (UNIX seconds); naive datetimes are taken as UTC.
+        
+        Args:
+            claims: Token claims
+            
+        Returns:
+            str: Encoded JWT
+        """
+        for claim in _TIME_CLAIMS:
+            value = claims.get(claim)
+            if isinstance(value, datetime):
+                claims[claim] = calendar.timegm(value.utctimetuple())
+        
+        signing_input = self._header_segment + b"." + _b64url_encode(orjson.dumps(claims))
+        signature = self._sign(signing_input)
+        return (signing_input + b"." + _b64url_encode(signature)).decode("ascii")
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        """Compute the HMAC signature of a token's signing input.
+        
+        Args:
+            signing_input: Encoded header and payload, joined by "."
+            
+        Returns:
+            bytes: Raw signature
+        """
+        mac = self._hmac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def _decode(self, token: str, verify: bool = True) -> Dict:
+        """Decode a compact JWT, checking signature and time claims.
+        
+        Args:
+            token: JWT token to decode
+            verify: Whether to check the algorithm, signature, exp and nbf
+            
+        Returns:
+            Dict: Token payload
+            
+        Raises:
+            JWTError: If the token is malformed, badly signed or expired
+        """
+        try:
+            signing_input, _, signature_segment = token.encode("ascii").rpartition(b".")
+            header_segment, _, payload_segment = signing_input.partition(b".")
+            header = orjson.loads(_b64url_decode(header_segment))
+            payload = orjson.loads(_b64url_decode(payload_segment))
+            signature = _b64url_decode(signature_segment)
+        except ValueError as e:
+            raise JWTError("Malformed token") from e
+        
+        if not isinstance(header, dict) or not isinstance(payload, dict):
+            raise JWTError("Malformed token")
+        
+        if not verify:
+            return payload
+        
+        if header.get("alg") != self.algorithm:
+            raise JWTError("Unexpected signing algorithm")
+        
+        if not hmac.compare_digest(self._sign(signing_input), signature):
+            raise JWTError("Signature verification failed")
+        
+        now = time.time()
+        exp = payload.get("exp")
+        if exp is not None and (not isinstance(exp, (int, float)) or exp <= now):
+            raise JWTError("Signature has expired")
+        nbf = payload.get("nbf")
+        if nbf is not None and (not isinstance(nbf, (int, float)) or nbf > now):
+            raise JWTError("The token is not yet valid")
+        
+        return payload
+
 
 # Global JWT handler instance
 jwt_handler = JWTHandler()
@@ -5,12 +5,19 @@ using bcrypt. All passwords are hashed before storage and never
 stored in plain text.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
 import bcrypt
 
 from app.infrastructure.config.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Identifiers of the bcrypt hash variants
+_BCRYPT_PREFIXES = frozenset({"$2a$", "$2b$", "$2y$"})
+
 
 class PasswordHasher:
     """Password hashing and verification using bcrypt.
@@ -30,6 +37,8 @@ class PasswordHasher:
                    but slower. Each increment doubles the computation time.
         """
         self.rounds = rounds
+        # Cost field as it appears in a bcrypt hash, e.g. "12"
+        self._rounds_field = "%02d" % rounds
 
     def hash_password(self, password: str) -> str:
         """Hash a plain text password.
@@ -79,6 +88,25 @@ class PasswordHasher:
             logger.error("Password verification failed", error=str(e))
             return False
 
+    def verify_many(self, pairs: List[Tuple[str, str]]) -> List[bool]:
+        """Verify several passwords against their hashes in parallel.
+        
+        bcrypt releases the GIL while computing a hash, so the checks run
+        concurrently on a thread pool sized to the available cores.
+        
+        Args:
+            pairs: (plain_password, hashed_password) tuples
+            
+        Returns:
+            List[bool]: Verification results, in input order
+        """
+        if len(pairs) <= 1:
+            return [self.verify_password(plain, hashed) for plain, hashed in pairs]
+        
+        workers = min(len(pairs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda pair: self.verify_password(*pair), pairs))
+
     def needs_rehash(self, hashed_password: str) -> bool:
         """Check if a password hash needs to be updated.
         
@@ -91,20 +119,15 @@ class PasswordHasher:
         Returns:
             bool: True if hash should be updated, False otherwise
         """
-        try:
-            # Extract the cost factor from the hash
-            # bcrypt hashes have format: $2b$<cost>$<salt+hash>
-            hashed_bytes = hashed_password.encode('utf-8')
-            parts = hashed_bytes.split(b'$')
-            
-            if len(parts) >= 3:
-                current_rounds = int(parts[2])
-                return current_rounds != self.rounds
-            
-            return False
-        except Exception as e:
-            logger.error("Failed to check if rehash needed", error=str(e))
+        # bcrypt hashes have a fixed layout: $2b$<2-digit cost>$<salt+hash>
+        if (
+            len(hashed_password) < 7
+            or hashed_password[:4] not in _BCRYPT_PREFIXES
+            or hashed_password[6] != "$"
+        ):
             return False
+        
+        return hashed_password[4:6] != self._rounds_field
 
 
 # Global password hasher instance
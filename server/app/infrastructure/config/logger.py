@@ -25,7 +25,8 @@ def setup_logging() -> None:
         ),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=False,
+        # Level filtering is resolved once per logger instead of on every call
+        cache_logger_on_first_use=True,
     )
 
     # Configure standard logging
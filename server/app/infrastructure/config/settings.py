@@ -1,4 +1,5 @@
-from typing import List, Optional
+from functools import cached_property
+from typing import FrozenSet, List, Optional
 
 from pydantic import Field, PostgresDsn, RedisDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -31,10 +32,15 @@ class Settings(BaseSettings):
     )
     database_pool_size: int = 20
     database_max_overflow: int = 10
+    # 0 keeps prepared statements off for transaction-mode poolers (pgBouncer)
+    database_statement_cache_size: int = 0
+    database_pool_recycle: int = 300
 
     # Redis
     redis_url: RedisDsn = Field(default="redis://localhost:6379/0")
     redis_max_connections: int = 50
+    # Expiry of LLM responses shared between workers, in seconds
+    llm_response_cache_ttl: int = 86400
 
     # Auth
     jwt_secret_key: str = Field(default="your-super-secret-jwt-key-change-this")
@@ -51,9 +57,18 @@ class Settings(BaseSettings):
     anthropic_api_key: Optional[str] = None
     anthropic_model: str = "claude-3-5-sonnet-20241022"
 
+    # Outbound concurrency limits
+    llm_max_concurrency: int = 16
+    llm_stream_max_concurrency: int = 64
+    embedding_max_concurrency: int = 32
+
     # Tavily Search
     tavily_api_key: Optional[str] = None
     tavily_max_results: int = 5
+    tavily_max_concurrency: int = 4
+    # Start web searches alongside LLM intent classification; every
+    # speculative search is billed, even when the result is discarded
+    tavily_speculative_search: bool = False
 
     # LangSmith
     langchain_tracing_v2: bool = True
@@ -76,6 +91,11 @@ class Settings(BaseSettings):
         default=[".py", ".js", ".ts", ".java", ".go", ".rs", ".cpp", ".c", ".h"]
     )
 
+    @cached_property
+    def allowed_extension_set(self) -> FrozenSet[str]:
+        """Allowed file extensions as a set, for membership checks."""
+        return frozenset(self.allowed_extensions)
+
 
 # Global settings instance
 settings = Settings()
\ No newline at end of file
@@ -4,7 +4,8 @@ This module provides a service for performing web searches using the Tavily API.
 Tavily is optimized for AI applications and provides high-quality search results.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional, Set
 
 from tavily import TavilyClient
 
@@ -13,6 +14,19 @@ from app.infrastructure.config.settings import settings
 
 logger = get_logger(__name__)
 
+# Limits concurrent Tavily requests across all service instances
+_search_semaphore = asyncio.Semaphore(settings.tavily_max_concurrency)
+
+# Searches still running in a worker thread, including abandoned ones
+_inflight_searches: Set[asyncio.Task] = set()
+
+
+def _forget_search(task: asyncio.Task) -> None:
+    """Drop a finished search and consume its result or exception."""
+    _inflight_searches.discard(task)
+    if not task.cancelled():
+        task.exception()
+
 
 class TavilySearchService:
     """Service for performing web searches using Tavily API.
@@ -87,14 +101,21 @@ class TavilySearchService:
         )
         
         try:
-            # Perform search
-            response = self.client.search(
-                query=query,
-                max_results=max_results or self.max_results,
-                search_depth=search_depth,
-                include_answer=include_answer,
-                include_raw_content=include_raw_content,
+            # The worker thread cannot be interrupted, so a cancelled caller
+            # only stops waiting; the shielded task keeps the concurrency
+            # slot until the request actually finishes
+            task = asyncio.create_task(
+                self._search_limited(
+                    query=query,
+                    max_results=max_results or self.max_results,
+                    search_depth=search_depth,
+                    include_answer=include_answer,
+                    include_raw_content=include_raw_content,
+                )
             )
+            _inflight_searches.add(task)
+            task.add_done_callback(_forget_search)
+            response = await asyncio.shield(task)
             
             logger.info(
                 "Tavily search completed",
@@ -108,6 +129,19 @@ class TavilySearchService:
             logger.error("Tavily search failed", error=str(e), query=query)
             raise Exception(f"Web search failed: {str(e)}")
 
+    async def _search_limited(self, **kwargs: Any) -> Dict[str, Any]:
+        """Run a Tavily search in a worker thread under the concurrency limit.
+        
+        Args:
+            **kwargs: Arguments for TavilyClient.search
+            
+        Returns:
+            Dict[str, Any]: Tavily search response
+        """
+        async with _search_semaphore:
+            # Perform search off the event loop so it can overlap other awaits
+            return await asyncio.to_thread(self.client.search, **kwargs)
+
     def format_results_for_context(self, search_response: Dict[str, Any]) -> str:
         """Format search results into a readable context string.
         
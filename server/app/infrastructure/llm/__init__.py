@@ -1,9 +1,12 @@
 """LLM infrastructure package initialization."""
 
 from app.infrastructure.llm.anthropic_provider import AnthropicProvider
+from app.infrastructure.llm.batching_provider import BatchingEmbeddingProvider
+from app.infrastructure.llm.cache import LLMCache, get_cache_stats
 from app.infrastructure.llm.openai_provider import OpenAIProvider
 from app.infrastructure.llm.provider_factory import (
     LLMProviderType,
+    clear_providers,
     create_embedding_provider,
     create_llm_provider,
 )
@@ -11,7 +14,11 @@ from app.infrastructure.llm.provider_factory import (
 __all__ = [
     "OpenAIProvider",
     "AnthropicProvider",
+    "BatchingEmbeddingProvider",
+    "LLMCache",
+    "get_cache_stats",
     "LLMProviderType",
     "create_llm_provider",
     "create_embedding_provider",
+    "clear_providers",
 ]
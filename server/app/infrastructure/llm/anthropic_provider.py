@@ -4,17 +4,26 @@ This module provides the concrete implementation of the LLMProvider interface
 using Anthropic's Claude API. It supports chat completions with streaming.
 """
 
-from typing import AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
 from app.application.ports.output.llm.llm_provider import LLMProvider
 from app.infrastructure.config.logger import get_logger
 from app.infrastructure.config.settings import settings
+from app.infrastructure.llm.cache import LLMCache, response_cache
+from app.infrastructure.llm.limits import llm_semaphore, stream_semaphore
+from app.infrastructure.llm.messages import (
+    convert_messages,
+    generation_kwargs,
+    split_static_dynamic,
+)
 
 logger = get_logger(__name__)
 
+# Response length when the caller does not set max_tokens
+_DEFAULT_MAX_TOKENS = 4096
+
 
 class AnthropicProvider(LLMProvider):
     """Anthropic implementation of LLMProvider.
@@ -49,9 +58,14 @@ class AnthropicProvider(LLMProvider):
             api_key=self.api_key,
             model=self.model_name,
             temperature=0.7,
+            # Claude requires max_tokens on every request
+            max_tokens=_DEFAULT_MAX_TOKENS,
             streaming=True,
         )
         
+        # Forced-tool classifiers, keyed by label set
+        self._classifiers: Dict[Tuple[str, ...], Any] = {}
+        
         logger.info("Anthropic provider initialized", model=self.model_name)
 
     async def generate(
@@ -62,6 +76,9 @@ class AnthropicProvider(LLMProvider):
     ) -> str:
         """Generate a chat completion.
         
+        Deterministic (temperature 0) requests are served from the shared
+        response cache when an identical request was made before.
+        
         Args:
             messages: List of message dicts with 'role' and 'content' keys
             temperature: Sampling temperature (0.0 to 1.0)
@@ -70,29 +87,88 @@ class AnthropicProvider(LLMProvider):
         Returns:
             str: Generated response content
         """
+        cache_key = None
+        if temperature == 0:
+            cache_key = LLMCache.make_key(self.model_name, messages, temperature, max_tokens)
+            cached = await response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             # Convert to LangChain message format
             lc_messages = self._convert_messages(messages)
             
-            # Update temperature if different from default
-            if temperature != 0.7:
-                self.chat_model.temperature = temperature
-            
-            # Update max_tokens if provided
-            # Claude requires max_tokens to be set
-            if max_tokens is not None:
-                self.chat_model.max_tokens = max_tokens
-            elif not hasattr(self.chat_model, 'max_tokens') or self.chat_model.max_tokens is None:
-                self.chat_model.max_tokens = 4096
+            call_kwargs = generation_kwargs(temperature, max_tokens)
             
             # Generate response
-            response = await self.chat_model.ainvoke(lc_messages)
+            async with llm_semaphore:
+                response = await self.chat_model.ainvoke(lc_messages, **call_kwargs)
+            
+            if cache_key is not None:
+                await response_cache.set(cache_key, response.content)
             
             return response.content
         except Exception as e:
             logger.error("Anthropic generation failed", error=str(e))
             raise
 
+    async def generate_classification(
+        self,
+        messages: List[Dict[str, str]],
+        labels: List[str],
+    ) -> str:
+        """Classify a conversation using forced tool use.
+        
+        Claude is required to call a single tool whose input schema
+        restricts the label to the allowed values.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            labels: Allowed classification labels
+            
+        Returns:
+            str: One of the provided labels
+        """
+        try:
+            lc_messages = self._convert_messages(messages)
+            
+            async with llm_semaphore:
+                response = await self._get_classifier(tuple(labels)).ainvoke(lc_messages)
+            
+            return response.tool_calls[0]["args"]["label"]
+        except Exception as e:
+            logger.error("Anthropic classification failed", error=str(e))
+            raise
+
+    def _get_classifier(self, labels: Tuple[str, ...]):
+        """Get the forced-tool chat model for a label set.
+        
+        Bound models are built once per label set and reused.
+        
+        Args:
+            labels: Allowed classification labels
+            
+        Returns:
+            Chat model bound to a classify tool restricted to the labels
+        """
+        classifier = self._classifiers.get(labels)
+        if classifier is None:
+            classify_tool = {
+                "name": "classify",
+                "description": "Record the category of the user request.",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {"label": {"type": "string", "enum": list(labels)}},
+                    "required": ["label"],
+                },
+            }
+            classifier = self.chat_model.bind_tools(
+                [classify_tool],
+                tool_choice={"type": "tool", "name": "classify"},
+            ).bind(temperature=0, max_tokens=64)
+            self._classifiers[labels] = classifier
+        return classifier
+
     async def generate_stream(
         self,
         messages: List[Dict[str, str]],
@@ -116,25 +192,19 @@ class AnthropicProvider(LLMProvider):
             # Convert to LangChain message format
             lc_messages = self._convert_messages(messages)
             
-            # Update temperature if different from default
-            if temperature != 0.7:
-                self.chat_model.temperature = temperature
-            
-            # Update max_tokens if provided
-            if max_tokens is not None:
-                self.chat_model.max_tokens = max_tokens
-            elif not hasattr(self.chat_model, 'max_tokens') or self.chat_model.max_tokens is None:
-                self.chat_model.max_tokens = 4096
+            call_kwargs = generation_kwargs(temperature, max_tokens)
             
             # Stream response
-            async for chunk in self.chat_model.astream(lc_messages):
-                if chunk.content:
-                    yield chunk.content
+            async with stream_semaphore:
+                async for chunk in self.chat_model.astream(lc_messages, **call_kwargs):
+                    content = chunk.content
+                    if content:
+                        yield content
         except Exception as e:
             logger.error("Anthropic streaming failed", error=str(e))
             raise
 
-    async def generate_embedding(self, text: str) -> List[float]:
+    async def get_embedding(self, text: str) -> List[float]:
         """Generate embedding vector for text.
         
         Note: Anthropic does not provide embedding models.
@@ -147,7 +217,7 @@ class AnthropicProvider(LLMProvider):
             "Anthropic does not provide embedding models. Use OpenAI provider for embeddings."
         )
 
-    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Generate embedding vectors for multiple texts.
         
         Note: Anthropic does not provide embedding models.
@@ -164,22 +234,18 @@ class AnthropicProvider(LLMProvider):
     def _convert_messages(messages: List[Dict[str, str]]) -> List:
         """Convert message dicts to LangChain message objects.
         
+        Messages are memoized by role and content, so the unchanged
+        history of a conversation is not rebuilt on every turn. System
+        messages are moved to the front and the last one is marked with
+        an ephemeral cache_control breakpoint, so Anthropic serves the
+        static prefix from its prompt cache.
+        
         Args:
             messages: List of message dicts with 'role' and 'content' keys
             
         Returns:
             List: List of LangChain message objects
         """
-        lc_messages = []
-        for msg in messages:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            
-            if role == "system":
-                lc_messages.append(SystemMessage(content=content))
-            elif role == "assistant":
-                lc_messages.append(AIMessage(content=content))
-            else:  # user or any other role
-                lc_messages.append(HumanMessage(content=content))
-        
-        return lc_messages
+        messages, static_count = split_static_dynamic(messages)
+        breakpoints = (static_count - 1,) if static_count else ()
+        return convert_messages(messages, cache_breakpoints=breakpoints)
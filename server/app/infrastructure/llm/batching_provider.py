@@ -0,0 +1,193 @@
+"""Embedding micro-batching provider.
+
+This module provides an LLMProvider wrapper that coalesces concurrent
+single-text embedding requests into one batched request to the
+underlying provider.
+"""
+
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from app.application.ports.output.llm.llm_provider import LLMProvider
+from app.infrastructure.config.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BatchingEmbeddingProvider(LLMProvider):
+    """LLMProvider wrapper that micro-batches single-text embeddings.
+
+    Each get_embedding() call is queued; a background task drains the
+    queue into batches of up to max_batch texts, waiting at most
+    max_wait_ms after the first queued text, and embeds each batch with
+    one get_embeddings() call on the wrapped provider. All other calls
+    are passed through unchanged.
+
+    Attributes:
+        provider: Wrapped LLM provider
+        max_batch: Maximum number of texts per batched request
+        max_wait: Maximum time in seconds to wait for a batch to fill
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        max_batch: int = 128,
+        max_wait_ms: float = 5,
+    ):
+        """Initialize the batching provider.
+        
+        Args:
+            provider: LLM provider used for the batched requests
+            max_batch: Maximum number of texts per batched request
+            max_wait_ms: Maximum time to wait for a batch to fill, in milliseconds
+        """
+        self.provider = provider
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    def __getattr__(self, name: str):
+        """Expose attributes of the wrapped provider, such as model_name."""
+        return getattr(self.provider, name)
+
+    async def generate(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> str:
+        """Generate a response from the wrapped provider."""
+        return await self.provider.generate(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+
+    async def generate_classification(
+        self,
+        messages: List[Dict[str, str]],
+        labels: List[str],
+    ) -> str:
+        """Classify the conversation with the wrapped provider."""
+        return await self.provider.generate_classification(messages, labels)
+
+    async def generate_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """Stream a response from the wrapped provider."""
+        async for chunk in self.provider.generate_stream(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ):
+            yield chunk
+
+    async def get_embedding(self, text: str) -> List[float]:
+        """Get embedding for text, batched with concurrent requests.
+        
+        Args:
+            text: Text to embed
+        
+        Returns:
+            List[float]: Embedding vector
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple texts in one request.
+        
+        Args:
+            texts: Texts to embed
+        
+        Returns:
+            List[List[float]]: Embedding vectors, in input order
+        """
+        return await self.provider.get_embeddings(texts)
+
+    async def aclose(self) -> None:
+        """Stop the batching task and cancel all pending embeddings.
+        
+        Callers still waiting on a queued or in-flight text get a
+        CancelledError. A later get_embedding() starts a new task.
+        """
+        tasks = list(self._flushes)
+        if self._worker is not None:
+            tasks.append(self._worker)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+        
+        self._queue = None
+        self._worker = None
+        self._flushes.clear()
+
+    async def _run(self) -> None:
+        """Drain queued texts into batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            
+            try:
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            
+            # Embed in the background so the next batch can start filling
+            task = asyncio.create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Embed a batch and resolve the waiting futures.
+        
+        Args:
+            batch: Queued (text, future) pairs
+        """
+        try:
+            vectors = await self.provider.get_embeddings([text for text, _ in batch])
+            if len(vectors) != len(batch):
+                raise ValueError(
+                    f"Expected {len(batch)} embeddings, got {len(vectors)}"
+                )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.error("Batched embedding failed", batch_size=len(batch), error=str(e))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
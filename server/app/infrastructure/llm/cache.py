@@ -0,0 +1,286 @@
+"""Exact-match response cache for LLM providers.
+
+Responses are keyed by a hash of the full request payload and only
+cached for deterministic (temperature 0) requests, so a hit returns
+exactly what the provider would have.
+
+The cache has two tiers: an in-process LRU checked first, and Redis
+shared by every worker. A Redis hit is copied into the local tier.
+"""
+
+import hashlib
+import time
+import zlib
+from typing import Dict, List, Optional, Protocol
+
+import orjson
+from cachetools import LRUCache
+
+from app.infrastructure.config.logger import get_logger
+from app.infrastructure.config.settings import settings
+
+logger = get_logger(__name__)
+
+# Maximum number of cached responses per process
+_RESPONSE_CACHE_SIZE = 1024
+
+# Redis key namespace for shared responses
+_REDIS_KEY_PREFIX = "llm:response:"
+
+# How long to skip Redis after it fails, in seconds
+_REDIS_RETRY_SECONDS = 30.0
+
+
+class CacheBackend(Protocol):
+    """Storage tier used by LLMCache."""
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up a cached response, None on a miss."""
+        ...
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response."""
+        ...
+
+
+class InMemoryBackend:
+    """Per-process LRU tier.
+    
+    Attributes:
+        maxsize: Maximum number of cached responses
+    """
+
+    def __init__(self, maxsize: int = _RESPONSE_CACHE_SIZE):
+        """Initialize an empty LRU.
+        
+        Args:
+            maxsize: Maximum number of cached responses
+        """
+        self.maxsize = maxsize
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up a cached response.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Optional[str]: Cached response content, None on a miss
+        """
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response, evicting the least recently used one if full.
+        
+        Args:
+            key: Cache key
+            value: Response content
+        """
+        self._entries[key] = value
+
+    def __len__(self) -> int:
+        """Number of cached responses."""
+        return len(self._entries)
+
+
+class RedisBackend:
+    """Redis tier shared by all workers.
+    
+    Responses are zlib-compressed, since completions are often several
+    kilobytes. Redis errors are logged and treated as misses, and Redis
+    is skipped for a short while after a failure so an outage does not
+    add a connection attempt to every request.
+    
+    Attributes:
+        ttl: Expiry of stored responses, in seconds
+    """
+
+    def __init__(self, ttl: int = settings.llm_response_cache_ttl):
+        """Initialize the Redis tier.
+        
+        Args:
+            ttl: Expiry of stored responses, in seconds
+        """
+        self.ttl = ttl
+        self._retry_at = 0.0
+
+    async def _client(self):
+        """Get the shared Redis client, or None while Redis is unavailable."""
+        if time.monotonic() < self._retry_at:
+            return None
+        
+        from app.infrastructure.persistence.redis.client import get_redis_client
+        
+        try:
+            return await get_redis_client()
+        except Exception as e:
+            self._backoff("connect", e)
+            return None
+
+    def _backoff(self, operation: str, error: Exception) -> None:
+        """Skip Redis for a while after a failure.
+        
+        Args:
+            operation: Operation that failed
+            error: Raised exception
+        """
+        self._retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
+        logger.warning(
+            "LLM response cache Redis tier unavailable",
+            operation=operation,
+            error=str(error),
+        )
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up a cached response.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Optional[str]: Cached response content, None on a miss
+        """
+        client = await self._client()
+        if client is None:
+            return None
+        
+        try:
+            value = await client.get(_REDIS_KEY_PREFIX + key)
+        except Exception as e:
+            self._backoff("get", e)
+            return None
+        
+        if value is None:
+            return None
+        return zlib.decompress(value).decode("utf-8")
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response unless another worker already did.
+        
+        Args:
+            key: Cache key
+            value: Response content
+        """
+        client = await self._client()
+        if client is None:
+            return
+        
+        try:
+            await client.set(
+                _REDIS_KEY_PREFIX + key,
+                zlib.compress(value.encode("utf-8")),
+                ex=self.ttl,
+                nx=True,
+            )
+        except Exception as e:
+            self._backoff("set", e)
+
+
+class LLMCache:
+    """Two-tier cache of LLM responses keyed by request payload.
+    
+    Lookups check the local tier first, then the shared tier; a shared
+    hit is promoted into the local tier. Writes go to both tiers.
+    
+    Attributes:
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that had to call the provider
+    """
+
+    def __init__(
+        self,
+        maxsize: int = _RESPONSE_CACHE_SIZE,
+        shared: Optional[CacheBackend] = None,
+    ):
+        """Initialize an empty cache.
+        
+        Args:
+            maxsize: Maximum number of responses in the local tier
+            shared: Optional tier shared across processes
+        """
+        self._local = InMemoryBackend(maxsize)
+        self._shared = shared
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+    ) -> str:
+        """Build the cache key for a chat completion request.
+        
+        Args:
+            model: Model name
+            messages: List of message dicts with 'role' and 'content' keys
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+        
+        Returns:
+            str: 128-bit BLAKE2b hex digest of the normalized request
+        """
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        return hashlib.blake2b(
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up a cached response.
+        
+        Args:
+            key: Cache key from make_key()
+        
+        Returns:
+            Optional[str]: Cached response content, None on a miss
+        """
+        value = await self._local.get(key)
+        if value is None and self._shared is not None:
+            value = await self._shared.get(key)
+            if value is not None:
+                await self._local.set(key, value)
+        
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response in every tier.
+        
+        Args:
+            key: Cache key from make_key()
+            value: Response content
+        """
+        await self._local.set(key, value)
+        if self._shared is not None:
+            await self._shared.set(key, value)
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters.
+        
+        Returns:
+            Dict[str, int]: Hits, misses and current local tier size
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._local)}
+
+
+# Shared by every provider instance in the process
+response_cache = LLMCache(shared=RedisBackend())
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """Get hit/miss counters for the shared response cache.
+    
+    Returns:
+        Dict[str, int]: Hits, misses and current size
+    """
+    return response_cache.stats()
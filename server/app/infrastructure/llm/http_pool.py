@@ -0,0 +1,65 @@
+"""Shared HTTP connection pool for OpenAI clients.
+
+The OpenAI chat and embedding clients send their requests through one
+process-wide httpx.AsyncClient, so warm keep-alive connections are
+reused instead of each client paying its own TCP and TLS setup.
+ChatAnthropic is not connected to it and keeps its own pool.
+HTTP/2 is enabled, so concurrent streaming completions are multiplexed
+over a few connections instead of each holding one of its own.
+"""
+
+from typing import Optional
+
+import httpx
+
+from app.infrastructure.config.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Global HTTP client instance
+http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get or create the shared async HTTP client.
+    
+    The client is created on first access and reused for subsequent calls.
+    Creation is synchronous, so providers can take the client in their
+    constructors.
+    
+    Returns:
+        httpx.AsyncClient: Shared async HTTP client
+    """
+    global http_client
+    
+    if http_client is None or http_client.is_closed:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=1000,
+                max_keepalive_connections=200,
+                keepalive_expiry=60,
+            ),
+            timeout=httpx.Timeout(300.0),
+            http2=True,
+        )
+        logger.info("LLM HTTP connection pool created")
+    
+    return http_client
+
+
+async def close_async_http_client() -> None:
+    """Close the shared async HTTP client.
+    
+    Should be called during application shutdown to close pooled
+    connections.
+    """
+    global http_client
+    
+    if http_client is not None:
+        try:
+            await http_client.aclose()
+            logger.info("LLM HTTP connection pool closed")
+            http_client = None
+        except Exception as e:
+            logger.error("Error closing LLM HTTP connection pool", error=str(e))
@@ -0,0 +1,20 @@
+"""Outbound request limits for LLM providers.
+
+Semaphores here are shared by every provider instance in the process,
+so bursts of requests queue locally instead of piling up against the
+provider's rate limits.
+"""
+
+import asyncio
+
+from app.infrastructure.config.settings import settings
+
+# Chat and classification requests across all providers
+llm_semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+
+# Streaming requests, which stay open while slow clients read them and
+# so must not hold slots needed by the short calls above
+stream_semaphore = asyncio.Semaphore(settings.llm_stream_max_concurrency)
+
+# Embedding requests, which the embedding endpoints parallelize further
+embedding_semaphore = asyncio.Semaphore(settings.embedding_max_concurrency)
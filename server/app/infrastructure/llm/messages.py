@@ -0,0 +1,109 @@
+"""LangChain message conversion and call parameters shared by LLM providers.
+
+Conversation history is resent on every turn, so converted messages
+are memoized by (role, content) and an unchanged prefix costs a cache
+lookup per message instead of a fresh pydantic model.
+
+Provider-side prompt caches match on the longest identical prefix, so
+static content (system prompt, tool definitions) belongs at the front
+and per-turn content (memory, retrieved context) at the end.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+
+
+# Message class per role; any other role is sent as a user message
+_ROLE_TO_CLS = {"system": SystemMessage, "assistant": AIMessage, "user": HumanMessage}
+
+# Anthropic prompt-cache marker, valid for the provider's short cache TTL
+_EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+@lru_cache(maxsize=4096)
+def to_langchain_message(role: str, content: str, cache_control: bool = False) -> BaseMessage:
+    """Convert a role and content pair to a LangChain message.
+    
+    Returned messages are shared between calls and must not be mutated;
+    build a new message when per-request fields are needed.
+    
+    Args:
+        role: Message role ('system', 'assistant', anything else is user)
+        content: Message content
+        cache_control: Whether to mark the message as the end of a
+            cacheable prompt prefix (Anthropic prompt caching)
+        
+    Returns:
+        BaseMessage: Shared LangChain message object
+    """
+    body = content
+    if cache_control and content:
+        body = [{"type": "text", "text": content, "cache_control": _EPHEMERAL_CACHE_CONTROL}]
+    
+    return _ROLE_TO_CLS.get(role, HumanMessage)(content=body)
+
+
+def convert_messages(
+    messages: List[Dict[str, str]],
+    cache_breakpoints: Iterable[int] = (),
+) -> List[BaseMessage]:
+    """Convert message dicts to LangChain message objects.
+    
+    Args:
+        messages: List of message dicts with 'role' and 'content' keys
+        cache_breakpoints: Indices of messages that end a cacheable prefix
+        
+    Returns:
+        List[BaseMessage]: List of LangChain message objects
+    """
+    breakpoints = frozenset(cache_breakpoints)
+    return [
+        to_langchain_message(msg.get("role", "user"), msg.get("content", ""), i in breakpoints)
+        for i, msg in enumerate(messages)
+    ]
+
+
+def split_static_dynamic(
+    messages: List[Dict[str, str]],
+) -> Tuple[List[Dict[str, str]], int]:
+    """Move system messages ahead of the conversation.
+    
+    System messages carry the static part of a prompt, so placing them
+    first gives every request in a conversation the same prefix. The
+    relative order within each group is kept.
+    
+    Args:
+        messages: List of message dicts with 'role' and 'content' keys
+        
+    Returns:
+        Tuple[List[Dict[str, str]], int]: Reordered messages and the
+            length of the static prefix
+    """
+    static = [msg for msg in messages if msg.get("role") == "system"]
+    if all(msg.get("role") == "system" for msg in messages[:len(static)]):
+        return messages, len(static)
+    
+    dynamic = [msg for msg in messages if msg.get("role") != "system"]
+    return static + dynamic, len(static)
+
+
+def generation_kwargs(temperature: float, max_tokens: Optional[int]) -> Dict[str, Any]:
+    """Build generation parameters for one ainvoke/astream call.
+    
+    Providers share one chat model across concurrent requests, so these
+    are passed with each call instead of being set on the model, where
+    requests would overwrite each other's settings.
+    
+    Args:
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate, None for the model default
+        
+    Returns:
+        Dict[str, Any]: Keyword arguments for ainvoke/astream
+    """
+    kwargs: Dict[str, Any] = {"temperature": temperature}
+    if max_tokens is not None:
+        kwargs["max_tokens"] = max_tokens
+    return kwargs
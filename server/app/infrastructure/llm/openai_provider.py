@@ -4,17 +4,28 @@ This module provides the concrete implementation of the LLMProvider interface
 using OpenAI's API. It supports both chat completions and embeddings generation.
 """
 
-from typing import AsyncIterator, Dict, List, Optional
+import hashlib
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import numpy as np
+import orjson
+from cachetools import LRUCache
 
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
 from app.application.ports.output.llm.llm_provider import LLMProvider
 from app.infrastructure.config.logger import get_logger
 from app.infrastructure.config.settings import settings
+from app.infrastructure.llm.cache import LLMCache, response_cache
+from app.infrastructure.llm.http_pool import get_async_http_client
+from app.infrastructure.llm.limits import embedding_semaphore, llm_semaphore, stream_semaphore
+from app.infrastructure.llm.messages import convert_messages, generation_kwargs
 
 logger = get_logger(__name__)
 
+# Embeddings kept per provider, about 60MB at 1536 float32 dimensions
+_EMBEDDING_CACHE_SIZE = 10_000
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI implementation of LLMProvider.
@@ -54,14 +65,22 @@ class OpenAIProvider(LLMProvider):
             model=self.model_name,
             temperature=0.7,
             streaming=True,
+            http_async_client=get_async_http_client(),
         )
         
+        # Structured-output classifiers, keyed by label set
+        self._classifiers: Dict[Tuple[str, ...], Any] = {}
+        
         # Initialize embedding model
         self.embedding_model = OpenAIEmbeddings(
             api_key=self.api_key,
             model=self.embedding_model_name,
+            http_async_client=get_async_http_client(),
         )
         
+        # Embedding vectors keyed by content hash, stored as float32
+        self._embedding_cache: LRUCache = LRUCache(maxsize=_EMBEDDING_CACHE_SIZE)
+        
         logger.info(
             "OpenAI provider initialized",
             model=self.model_name,
@@ -76,6 +95,9 @@ class OpenAIProvider(LLMProvider):
     ) -> str:
         """Generate a chat completion.
         
+        Deterministic (temperature 0) requests are served from the shared
+        response cache when an identical request was made before.
+        
         Args:
             messages: List of message dicts with 'role' and 'content' keys
             temperature: Sampling temperature (0.0 to 2.0)
@@ -84,26 +106,94 @@ class OpenAIProvider(LLMProvider):
         Returns:
             str: Generated response content
         """
+        cache_key = None
+        if temperature == 0:
+            cache_key = LLMCache.make_key(self.model_name, messages, temperature, max_tokens)
+            cached = await response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             # Convert to LangChain message format
             lc_messages = self._convert_messages(messages)
             
-            # Update temperature if different from default
-            if temperature != 0.7:
-                self.chat_model.temperature = temperature
-            
-            # Update max_tokens if provided
-            if max_tokens is not None:
-                self.chat_model.max_tokens = max_tokens
+            call_kwargs = generation_kwargs(temperature, max_tokens)
             
             # Generate response
-            response = await self.chat_model.ainvoke(lc_messages)
+            async with llm_semaphore:
+                response = await self.chat_model.ainvoke(lc_messages, **call_kwargs)
+            
+            if cache_key is not None:
+                await response_cache.set(cache_key, response.content)
             
             return response.content
         except Exception as e:
             logger.error("OpenAI generation failed", error=str(e))
             raise
 
+    async def generate_classification(
+        self,
+        messages: List[Dict[str, str]],
+        labels: List[str],
+    ) -> str:
+        """Classify a conversation using structured outputs.
+        
+        The response is constrained by a JSON schema whose only field is
+        an enum of the allowed labels, so the model cannot answer with
+        anything else.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            labels: Allowed classification labels
+            
+        Returns:
+            str: One of the provided labels
+        """
+        try:
+            lc_messages = self._convert_messages(messages)
+            
+            async with llm_semaphore:
+                response = await self._get_classifier(tuple(labels)).ainvoke(lc_messages)
+            
+            return orjson.loads(response.content)["label"]
+        except Exception as e:
+            logger.error("OpenAI classification failed", error=str(e))
+            raise
+
+    def _get_classifier(self, labels: Tuple[str, ...]):
+        """Get the structured-output chat model for a label set.
+        
+        Bound models are built once per label set and reused.
+        
+        Args:
+            labels: Allowed classification labels
+            
+        Returns:
+            Chat model bound to a JSON schema restricted to the labels
+        """
+        classifier = self._classifiers.get(labels)
+        if classifier is None:
+            response_format = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "classification",
+                    "strict": True,
+                    "schema": {
+                        "type": "object",
+                        "properties": {"label": {"type": "string", "enum": list(labels)}},
+                        "required": ["label"],
+                        "additionalProperties": False,
+                    },
+                },
+            }
+            classifier = self.chat_model.bind(
+                response_format=response_format,
+                temperature=0,
+                max_tokens=16,
+            )
+            self._classifiers[labels] = classifier
+        return classifier
+
     async def generate_stream(
         self,
         messages: List[Dict[str, str]],
@@ -127,23 +217,19 @@ class OpenAIProvider(LLMProvider):
             # Convert to LangChain message format
             lc_messages = self._convert_messages(messages)
             
-            # Update temperature if different from default
-            if temperature != 0.7:
-                self.chat_model.temperature = temperature
-            
-            # Update max_tokens if provided
-            if max_tokens is not None:
-                self.chat_model.max_tokens = max_tokens
+            call_kwargs = generation_kwargs(temperature, max_tokens)
             
             # Stream response
-            async for chunk in self.chat_model.astream(lc_messages):
-                if chunk.content:
-                    yield chunk.content
+            async with stream_semaphore:
+                async for chunk in self.chat_model.astream(lc_messages, **call_kwargs):
+                    content = chunk.content
+                    if content:
+                        yield content
         except Exception as e:
             logger.error("OpenAI streaming failed", error=str(e))
             raise
 
-    async def generate_embedding(self, text: str) -> List[float]:
+    async def get_embedding(self, text: str) -> List[float]:
         """Generate embedding vector for text.
         
         Args:
@@ -153,16 +239,17 @@ class OpenAIProvider(LLMProvider):
             List[float]: Embedding vector (1536 dimensions for text-embedding-3-small)
         """
         try:
-            embeddings = await self.embedding_model.aembed_documents([text])
-            return embeddings[0]
+            return (await self.get_embeddings([text]))[0]
         except Exception as e:
             logger.error("OpenAI embedding generation failed", error=str(e))
             raise
 
-    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Generate embedding vectors for multiple texts.
         
-        Batch processing is more efficient than individual calls.
+        Batch processing is more efficient than individual calls. Texts
+        embedded before are served from the cache, and only the rest
+        (deduplicated) are sent to the API.
         
         Args:
             texts: List of texts to embed
@@ -171,32 +258,55 @@ class OpenAIProvider(LLMProvider):
             List[List[float]]: List of embedding vectors
         """
         try:
-            embeddings = await self.embedding_model.aembed_documents(texts)
-            return embeddings
+            keys = [self._embedding_key(text) for text in texts]
+            
+            found: Dict[bytes, List[float]] = {}
+            missing: Dict[bytes, str] = {}
+            for key, text in zip(keys, texts):
+                if key in found or key in missing:
+                    continue
+                cached = self._embedding_cache.get(key)
+                if cached is None:
+                    missing[key] = text
+                else:
+                    found[key] = cached.tolist()
+            
+            if missing:
+                async with embedding_semaphore:
+                    embeddings = await self.embedding_model.aembed_documents(
+                        list(missing.values())
+                    )
+                for key, embedding in zip(missing, embeddings):
+                    found[key] = embedding
+                    self._embedding_cache[key] = np.asarray(embedding, dtype=np.float32)
+            
+            return [found[key] for key in keys]
         except Exception as e:
             logger.error("OpenAI batch embedding generation failed", error=str(e))
             raise
 
+    def _embedding_key(self, text: str) -> bytes:
+        """Build the embedding cache key for a text.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            bytes: SHA-256 digest of the model name and text
+        """
+        return hashlib.sha256(f"{self.embedding_model_name}:{text}".encode("utf-8")).digest()
+
     @staticmethod
     def _convert_messages(messages: List[Dict[str, str]]) -> List:
         """Convert message dicts to LangChain message objects.
         
+        Messages are memoized by role and content, so the unchanged
+        history of a conversation is not rebuilt on every turn.
+        
         Args:
             messages: List of message dicts with 'role' and 'content' keys
             
         Returns:
             List: List of LangChain message objects
         """
-        lc_messages = []
-        for msg in messages:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            
-            if role == "system":
-                lc_messages.append(SystemMessage(content=content))
-            elif role == "assistant":
-                lc_messages.append(AIMessage(content=content))
-            else:  # user or any other role
-                lc_messages.append(HumanMessage(content=content))
-        
-        return lc_messages
+        return convert_messages(messages)
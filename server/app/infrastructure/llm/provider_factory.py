@@ -5,15 +5,19 @@ based on configuration. It supports OpenAI and Anthropic providers.
 """
 
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from app.application.ports.output.llm.llm_provider import LLMProvider
 from app.infrastructure.config.logger import get_logger
 from app.infrastructure.llm.anthropic_provider import AnthropicProvider
+from app.infrastructure.llm.batching_provider import BatchingEmbeddingProvider
 from app.infrastructure.llm.openai_provider import OpenAIProvider
 
 logger = get_logger(__name__)
 
+# Providers are process-wide singletons, keyed by factory arguments
+_providers: Dict[Tuple, LLMProvider] = {}
+
 
 class LLMProviderType(str, Enum):
     """Supported LLM provider types."""
@@ -31,6 +35,13 @@ def create_llm_provider(
     
     Factory function that creates the appropriate LLM provider based on
     the specified type. Defaults to OpenAI if no type is specified.
+    Providers are created once per (provider_type, api_key, model) and
+    shared by every later call with the same arguments.
+    
+    Both providers cache prompt prefixes (OpenAI automatically, Anthropic
+    at the cache_control breakpoint after the system messages), so
+    callers should put the system prompt and other static content first
+    and per-turn memory or retrieved context last.
     
     Args:
         provider_type: Type of provider to create
@@ -43,14 +54,36 @@ def create_llm_provider(
     Raises:
         ValueError: If provider_type is not supported
     """
+    key = ("llm", provider_type, api_key, model)
+    provider = _providers.get(key)
+    if provider is not None:
+        return provider
+    
     if provider_type == LLMProviderType.OPENAI:
         logger.info("Creating OpenAI provider")
-        return OpenAIProvider(api_key=api_key, model=model)
+        provider = OpenAIProvider(api_key=api_key, model=model)
     elif provider_type == LLMProviderType.ANTHROPIC:
         logger.info("Creating Anthropic provider")
-        return AnthropicProvider(api_key=api_key, model=model)
+        provider = AnthropicProvider(api_key=api_key, model=model)
     else:
         raise ValueError(f"Unsupported LLM provider type: {provider_type}")
+    
+    _providers[key] = provider
+    return provider
+
+
+async def clear_providers() -> None:
+    """Close and drop all cached provider instances.
+    
+    Providers hold the shared HTTP client, so this must be called
+    whenever that client is closed; later factory calls then build
+    providers on a fresh client. Embedding batching tasks are stopped
+    first.
+    """
+    for provider in _providers.values():
+        if isinstance(provider, BatchingEmbeddingProvider):
+            await provider.aclose()
+    _providers.clear()
 
 
 def create_embedding_provider(
@@ -60,7 +93,10 @@ def create_embedding_provider(
     """Create an embedding provider instance.
     
     Currently only OpenAI provides embedding models, so this always
-    returns an OpenAI provider instance.
+    returns an OpenAI provider instance. Concurrent single-text
+    get_embedding() calls are coalesced into batched requests. The
+    provider is created once per (api_key, model) and shared, so the
+    batching and embedding cache span the whole process.
     
     Args:
         api_key: Optional OpenAI API key (uses settings if not provided)
@@ -69,5 +105,12 @@ def create_embedding_provider(
     Returns:
         LLMProvider: OpenAI provider configured for embeddings
     """
-    logger.info("Creating embedding provider (OpenAI)")
-    return OpenAIProvider(api_key=api_key, embedding_model=model)
+    key = ("embedding", api_key, model)
+    provider = _providers.get(key)
+    if provider is None:
+        logger.info("Creating embedding provider (OpenAI)")
+        provider = BatchingEmbeddingProvider(
+            OpenAIProvider(api_key=api_key, embedding_model=model)
+        )
+        _providers[key] = provider
+    return provider
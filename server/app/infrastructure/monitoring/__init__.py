@@ -2,14 +2,14 @@
 
 from app.infrastructure.monitoring.langsmith import (
     get_langsmith_client,
+    get_langsmith_config,
     get_run_url,
     is_langsmith_enabled,
-    langsmith_config,
     log_agent_feedback,
 )
 
 __all__ = [
-    "langsmith_config",
+    "get_langsmith_config",
     "get_langsmith_client",
     "is_langsmith_enabled",
     "log_agent_feedback",
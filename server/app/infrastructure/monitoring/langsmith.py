@@ -4,8 +4,10 @@ This module configures LangSmith for tracing LangGraph agent execution,
 enabling debugging, performance monitoring, and conversation analysis.
 """
 
+import asyncio
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from langsmith import Client
 
@@ -14,6 +16,9 @@ from app.infrastructure.config.settings import settings
 
 logger = get_logger(__name__)
 
+# Feedback waiting to be posted; further feedback is dropped when full
+_FEEDBACK_QUEUE_SIZE = 1000
+
 
 class LangSmithConfig:
     """LangSmith configuration and client management.
@@ -33,6 +38,9 @@ class LangSmithConfig:
         self.client: Optional[Client] = None
         self.project_name = settings.langchain_project
         
+        self._feedback_queue: Optional[asyncio.Queue] = None
+        self._feedback_worker: Optional[asyncio.Task] = None
+        
         self._configure()
 
     def _configure(self) -> None:
@@ -100,7 +108,7 @@ class LangSmithConfig:
         
         return f"{settings.langchain_endpoint}/o/default/projects/p/{self.project_name}/r/{run_id}"
 
-    def log_feedback(
+    async def log_feedback(
         self,
         run_id: str,
         score: float,
@@ -109,7 +117,9 @@ class LangSmithConfig:
         """Log user feedback for a run.
         
         Records user feedback (thumbs up/down, ratings) for an agent
-        run, enabling quality tracking and model improvement.
+        run, enabling quality tracking and model improvement. Feedback is
+        queued and posted by a background task, so the caller never waits
+        on the LangSmith API.
         
         Args:
             run_id: LangSmith run identifier
@@ -120,6 +130,31 @@ class LangSmithConfig:
             logger.warning("LangSmith not enabled, cannot log feedback")
             return
 
+        if self._feedback_worker is None or self._feedback_worker.done():
+            self._feedback_queue = asyncio.Queue(maxsize=_FEEDBACK_QUEUE_SIZE)
+            self._feedback_worker = asyncio.create_task(self._run_feedback_worker())
+
+        try:
+            self._feedback_queue.put_nowait((run_id, score, comment))
+        except asyncio.QueueFull:
+            logger.warning("Feedback queue full, dropping feedback", run_id=run_id)
+
+    async def _run_feedback_worker(self) -> None:
+        """Post queued feedback until cancelled."""
+        queue = self._feedback_queue
+        
+        while True:
+            feedback = await queue.get()
+            # The LangSmith client is synchronous, so post from a worker thread
+            await asyncio.to_thread(self._post_feedback, feedback)
+
+    def _post_feedback(self, feedback: Tuple[str, float, Optional[str]]) -> None:
+        """Send one feedback entry to LangSmith.
+        
+        Args:
+            feedback: Queued (run_id, score, comment) entry
+        """
+        run_id, score, comment = feedback
         try:
             self.client.create_feedback(
                 run_id=run_id,
@@ -133,8 +168,19 @@ class LangSmithConfig:
             logger.error("Failed to log feedback", error=str(e), run_id=run_id)
 
 
-# Global LangSmith configuration instance
-langsmith_config = LangSmithConfig()
+@lru_cache(maxsize=1)
+def get_langsmith_config() -> LangSmithConfig:
+    """Get the global LangSmith configuration.
+    
+    The configuration (and its client) is created on first use instead of
+    at import time, so importing the monitoring package stays cheap. The
+    API lifespan calls this at startup so tracing is configured before
+    the first request.
+    
+    Returns:
+        LangSmithConfig: Process-wide LangSmith configuration
+    """
+    return LangSmithConfig()
 
 
 def get_langsmith_client() -> Optional[Client]:
@@ -143,7 +189,7 @@ def get_langsmith_client() -> Optional[Client]:
     Returns:
         Optional[Client]: LangSmith client or None if not configured
     """
-    return langsmith_config.get_client()
+    return get_langsmith_config().get_client()
 
 
 def is_langsmith_enabled() -> bool:
@@ -152,20 +198,21 @@ def is_langsmith_enabled() -> bool:
     Returns:
         bool: True if LangSmith is configured and enabled
     """
-    return langsmith_config.is_enabled()
+    return get_langsmith_config().is_enabled()
 
 
-def log_agent_feedback(run_id: str, score: float, comment: Optional[str] = None) -> None:
+async def log_agent_feedback(run_id: str, score: float, comment: Optional[str] = None) -> None:
     """Log feedback for an agent run.
     
     Convenience function to log user feedback for agent execution.
+    Returns once the feedback is queued; it is posted in the background.
     
     Args:
         run_id: LangSmith run identifier
         score: Feedback score (0.0 to 1.0)
         comment: Optional feedback comment
     """
-    langsmith_config.log_feedback(run_id, score, comment)
+    await get_langsmith_config().log_feedback(run_id, score, comment)
 
 
 def get_run_url(run_id: str) -> str:
@@ -177,4 +224,4 @@ def get_run_url(run_id: str) -> str:
     Returns:
         str: URL to LangSmith run viewer
     """
-    return langsmith_config.create_run_url(run_id)
+    return get_langsmith_config().create_run_url(run_id)
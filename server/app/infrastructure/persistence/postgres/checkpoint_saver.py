@@ -4,16 +4,15 @@ This module implements a checkpoint saver that stores LangGraph agent
 state in PostgreSQL, enabling conversation persistence and resumption.
 """
 
-import json
-from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
 from langgraph.checkpoint.base import BaseCheckpointSaver, Checkpoint
-from sqlalchemy import Column, DateTime, String, Text
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy import Column, DateTime, Index, String, insert, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.domain.clock import utcnow
 from app.infrastructure.config.logger import get_logger
 from app.infrastructure.persistence.postgres.database import Base
 
@@ -32,18 +31,36 @@ class CheckpointModel(Base):
         thread_id: Conversation/thread identifier
         checkpoint_id: LangGraph checkpoint ID
         parent_checkpoint_id: Parent checkpoint for branching
-        checkpoint_data: Serialized checkpoint state (JSON)
+        checkpoint_data: Serialized checkpoint state (JSONB)
         created_at: Checkpoint creation timestamp
     """
 
     __tablename__ = "agent_checkpoints"
 
     id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
-    thread_id = Column(String(255), nullable=False, index=True)
+    thread_id = Column(String(255), nullable=False)
     checkpoint_id = Column(String(255), nullable=False, unique=True)
     parent_checkpoint_id = Column(String(255), nullable=True)
-    checkpoint_data = Column(Text, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    checkpoint_data = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+
+    __table_args__ = (
+        Index("ix_agent_checkpoints_thread_created", "thread_id", text("created_at DESC")),
+    )
+
+
+# Statements are built once so SQLAlchemy reuses their compiled form
+_INSERT_CHECKPOINTS = insert(CheckpointModel)
+
+_SELECT_CHECKPOINTS = text(
+    """
+    SELECT checkpoint_data, checkpoint_id, parent_checkpoint_id
+    FROM agent_checkpoints
+    WHERE thread_id = :thread_id
+    ORDER BY created_at DESC
+    LIMIT :limit
+    """
+).columns(checkpoint_data=JSONB, checkpoint_id=String, parent_checkpoint_id=String)
 
 
 class PostgresCheckpointSaver(BaseCheckpointSaver):
@@ -55,6 +72,10 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
     - State recovery after errors
     - Conversation branching and replay
     
+    Checkpoints saved during a run are buffered and written in a single
+    multi-row INSERT when aflush() is called, instead of one round-trip
+    per node transition.
+    
     Attributes:
         session: SQLAlchemy async session
     """
@@ -67,6 +88,24 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
         """
         super().__init__()
         self.session = session
+        self._pending: List[Dict[str, Any]] = []
+
+    async def aflush(self) -> None:
+        """Write all buffered checkpoints in one transaction."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+
+        try:
+            await self.session.execute(_INSERT_CHECKPOINTS, pending)
+            await self.session.commit()
+
+            logger.info("Checkpoints flushed", count=len(pending))
+
+        except Exception as e:
+            logger.error("Failed to flush checkpoints", error=str(e), count=len(pending))
+            await self.session.rollback()
 
     async def aget(
         self,
@@ -90,16 +129,14 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
 
         logger.info("Retrieving checkpoint", thread_id=thread_id)
 
+        # Make buffered checkpoints visible to the read
+        await self.aflush()
+
         try:
             # Query for latest checkpoint
             result = await self.session.execute(
-                f"""
-                SELECT checkpoint_data, checkpoint_id, parent_checkpoint_id
-                FROM agent_checkpoints
-                WHERE thread_id = '{thread_id}'
-                ORDER BY created_at DESC
-                LIMIT 1
-                """
+                _SELECT_CHECKPOINTS,
+                {"thread_id": thread_id, "limit": 1},
             )
             row = result.fetchone()
 
@@ -108,7 +145,7 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
                 return None
 
             # Deserialize checkpoint
-            checkpoint_data = json.loads(row[0])
+            checkpoint_data = row[0]
             checkpoint = Checkpoint(
                 v=1,
                 id=row[1],
@@ -132,8 +169,8 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
     ) -> Dict[str, Any]:
         """Save a checkpoint to the database.
         
-        Stores the current agent state as a checkpoint, enabling
-        future resumption and replay.
+        Buffers the current agent state as a checkpoint, enabling
+        future resumption and replay. The write happens on aflush().
         
         Args:
             config: Configuration containing thread_id
@@ -158,20 +195,21 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
                 "versions_seen": checkpoint.versions_seen,
             }
 
-            # Create checkpoint record
-            checkpoint_model = CheckpointModel(
-                thread_id=thread_id,
-                checkpoint_id=checkpoint.id,
-                parent_checkpoint_id=checkpoint.parent_config.get("configurable", {}).get("checkpoint_id")
-                if checkpoint.parent_config
-                else None,
-                checkpoint_data=json.dumps(checkpoint_data),
+            # Buffer checkpoint record until the run is flushed
+            self._pending.append(
+                {
+                    "id": uuid4(),
+                    "thread_id": thread_id,
+                    "checkpoint_id": checkpoint.id,
+                    "parent_checkpoint_id": checkpoint.parent_config.get("configurable", {}).get("checkpoint_id")
+                    if checkpoint.parent_config
+                    else None,
+                    "checkpoint_data": checkpoint_data,
+                    "created_at": utcnow(),
+                }
             )
 
-            self.session.add(checkpoint_model)
-            await self.session.commit()
-
-            logger.info("Checkpoint saved", thread_id=thread_id, checkpoint_id=checkpoint.id)
+            logger.info("Checkpoint buffered", thread_id=thread_id, checkpoint_id=checkpoint.id)
 
             # Return updated config
             return {
@@ -184,7 +222,6 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
 
         except Exception as e:
             logger.error("Failed to save checkpoint", error=str(e), thread_id=thread_id)
-            await self.session.rollback()
             return config
 
     async def alist(
@@ -211,23 +248,21 @@ class PostgresCheckpointSaver(BaseCheckpointSaver):
 
         logger.info("Listing checkpoints", thread_id=thread_id, limit=limit)
 
+        # Make buffered checkpoints visible to the read
+        await self.aflush()
+
         try:
             # Query for checkpoints
             result = await self.session.execute(
-                f"""
-                SELECT checkpoint_data, checkpoint_id, parent_checkpoint_id
-                FROM agent_checkpoints
-                WHERE thread_id = '{thread_id}'
-                ORDER BY created_at DESC
-                LIMIT {limit}
-                """
+                _SELECT_CHECKPOINTS,
+                {"thread_id": thread_id, "limit": limit},
             )
             rows = result.fetchall()
 
             # Deserialize checkpoints
             checkpoints = []
             for row in rows:
-                checkpoint_data = json.loads(row[0])
+                checkpoint_data = row[0]
                 checkpoint = Checkpoint(
                     v=1,
                     id=row[1],
@@ -12,8 +12,10 @@ engine = create_async_engine(
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
     pool_pre_ping=True,
+    pool_recycle=settings.database_pool_recycle,
     connect_args={
-        "statement_cache_size": 0,  # Disable prepared statements for pgBouncer
+        # Keep at 0 behind pgBouncer; raise when connecting to Postgres directly
+        "statement_cache_size": settings.database_statement_cache_size,
         "server_settings": {
             "application_name": "bytebuddhi",
         },
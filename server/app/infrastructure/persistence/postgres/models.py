@@ -1,14 +1,14 @@
 """SQLAlchemy ORM models."""
 
-from datetime import datetime
 from uuid import uuid4
 
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 from sqlalchemy import (
     JSON,
     Boolean,
     Column,
     DateTime,
+    FetchedValue,
     ForeignKey,
     Index,
     Integer,
@@ -19,6 +19,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
+from app.domain.clock import utcnow
 from app.infrastructure.persistence.postgres.database import Base
 
 
@@ -31,8 +32,8 @@ class UserModel(Base):
     email = Column(String(255), unique=True, nullable=False, index=True)
     username = Column(String(100), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+    updated_at = Column(DateTime, nullable=False, default=utcnow, onupdate=utcnow)
     is_active = Column(Boolean, nullable=False, default=True)
     api_key = Column(String(255), unique=True, nullable=True, index=True)
     usage_quota = Column(Integer, nullable=False, default=1000)
@@ -55,8 +56,8 @@ class ProjectModel(Base):
     local_path = Column(String(500), nullable=True)
     language = Column(String(50), nullable=True)
     framework = Column(String(100), nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+    updated_at = Column(DateTime, nullable=False, default=utcnow, onupdate=utcnow)
     last_indexed_at = Column(DateTime, nullable=True)
     is_active = Column(Boolean, nullable=False, default=True)
 
@@ -80,13 +81,15 @@ class FileModel(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    # Owner copied from the parent row by a database trigger, used by RLS
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, server_default=FetchedValue())
     file_path = Column(String(1000), nullable=False)
     file_name = Column(String(255), nullable=False)
     file_type = Column(String(50), nullable=False)
     size_bytes = Column(Integer, nullable=False)
     content_hash = Column(String(64), nullable=False)
     last_modified = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
     is_deleted = Column(Boolean, nullable=False, default=False)
 
     # Relationships
@@ -97,6 +100,7 @@ class FileModel(Base):
     __table_args__ = (
         UniqueConstraint("project_id", "file_path", name="uq_project_file_path"),
         Index("ix_files_project_id", "project_id"),
+        Index("ix_files_user_id", "user_id"),
     )
 
 
@@ -108,12 +112,14 @@ class CodeChunkModel(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     file_id = Column(UUID(as_uuid=True), ForeignKey("files.id", ondelete="CASCADE"), nullable=False)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    # Owner copied from the parent row by a database trigger, used by RLS
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, server_default=FetchedValue())
     chunk_text = Column(Text, nullable=False)
     chunk_index = Column(Integer, nullable=False)
     start_line = Column(Integer, nullable=False)
     end_line = Column(Integer, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+    updated_at = Column(DateTime, nullable=False, default=utcnow, onupdate=utcnow)
     extra_metadata = Column(JSON, nullable=True, default=dict)
 
     # Relationships
@@ -124,6 +130,7 @@ class CodeChunkModel(Base):
     __table_args__ = (
         Index("ix_code_chunks_file_id", "file_id"),
         Index("ix_code_chunks_project_id", "project_id"),
+        Index("ix_code_chunks_user_id", "user_id"),
     )
 
 
@@ -135,9 +142,11 @@ class EmbeddingModel(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     code_chunk_id = Column(UUID(as_uuid=True), ForeignKey("code_chunks.id", ondelete="CASCADE"), nullable=False, unique=True)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
-    embedding = Column(Vector(1536), nullable=False)  # OpenAI embedding dimension
+    # Owner copied from the parent row by a database trigger, used by RLS
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, server_default=FetchedValue())
+    embedding = Column(HALFVEC(1536), nullable=False)  # OpenAI embedding dimension, stored as fp16
     model_name = Column(String(100), nullable=False)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
     extra_metadata = Column(JSON, nullable=True, default=dict)
 
     # Relationships
@@ -147,12 +156,13 @@ class EmbeddingModel(Base):
     # Constraints
     __table_args__ = (
         Index("ix_embeddings_project_id", "project_id"),
+        Index("ix_code_embeddings_user_id", "user_id"),
         Index(
             "ix_embeddings_vector",
             "embedding",
             postgresql_using="ivfflat",
             postgresql_with={"lists": 100},
-            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
         ),
     )
 
@@ -166,8 +176,8 @@ class ConversationModel(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="SET NULL"), nullable=True)
     title = Column(String(500), nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+    updated_at = Column(DateTime, nullable=False, default=utcnow, onupdate=utcnow)
     is_archived = Column(Boolean, nullable=False, default=False)
     extra_metadata = Column(JSON, nullable=True, default=dict)
 
@@ -190,9 +200,11 @@ class MessageModel(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False)
+    # Owner copied from the parent row by a database trigger, used by RLS
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, server_default=FetchedValue())
     role = Column(String(20), nullable=False)
     content = Column(Text, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
     extra_metadata = Column(JSON, nullable=True, default=dict)
     parent_message_id = Column(UUID(as_uuid=True), ForeignKey("messages.id", ondelete="SET NULL"), nullable=True)
     feedback = Column(Integer, nullable=True)
@@ -204,4 +216,5 @@ class MessageModel(Base):
     # Constraints
     __table_args__ = (
         Index("ix_messages_conversation_created", "conversation_id", "created_at"),
+        Index("ix_messages_user_id", "user_id"),
     )
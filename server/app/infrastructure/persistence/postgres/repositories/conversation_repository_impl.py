@@ -7,14 +7,15 @@ using SQLAlchemy async sessions. It handles all database operations for Conversa
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.ports.output.repository.conversation_repository import (
     ConversationRepository,
 )
 from app.domain.models.conversation import Conversation
-from app.infrastructure.persistence.postgres.models import ConversationModel
+from app.domain.models.message import Message
+from app.infrastructure.persistence.postgres.models import ConversationModel, MessageModel
 
 
 class ConversationRepositoryImpl(ConversationRepository):
@@ -52,7 +53,7 @@ class ConversationRepositoryImpl(ConversationRepository):
             created_at=conversation.created_at,
             updated_at=conversation.updated_at,
             is_archived=conversation.is_archived,
-            metadata=conversation.metadata,
+            metadata=conversation.metadata or {},
         )
         self.session.add(conversation_model)
         await self.session.flush()
@@ -117,11 +118,61 @@ class ConversationRepositoryImpl(ConversationRepository):
         conversation_model.title = conversation.title
         conversation_model.updated_at = conversation.updated_at
         conversation_model.is_archived = conversation.is_archived
-        conversation_model.metadata = conversation.metadata
+        conversation_model.metadata = conversation.metadata or {}
         
         await self.session.flush()
         return self._to_domain(conversation_model)
 
+    async def append_message_atomic(self, message: Message) -> Optional[Message]:
+        """Insert a message and update its conversation timestamp atomically.
+        
+        Both writes run as a single statement: the conversation UPDATE is a
+        data-modifying CTE and the message is inserted from its RETURNING row,
+        so nothing is inserted when the conversation does not exist.
+        
+        Args:
+            message: Domain Message entity to persist
+            
+        Returns:
+            Optional[Message]: The created message, or None if the conversation
+                was not found
+        """
+        touched = (
+            update(ConversationModel)
+            .where(ConversationModel.id == message.conversation_id)
+            .values(updated_at=message.created_at)
+            .returning(ConversationModel.id)
+            .cte("touched")
+        )
+        
+        columns = MessageModel.__table__.c
+        values = {
+            "id": message.id,
+            "role": message.role,
+            "content": message.content,
+            "created_at": message.created_at,
+            "extra_metadata": message.metadata or {},
+            "parent_message_id": message.parent_message_id,
+            "feedback": message.feedback,
+        }
+        
+        stmt = (
+            insert(MessageModel)
+            .from_select(
+                ["conversation_id", *values],
+                select(
+                    touched.c.id,
+                    *(literal(value, columns[name].type) for name, value in values.items()),
+                ),
+            )
+            .returning(MessageModel.id)
+        )
+        
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            return None
+        return message
+
     async def delete(self, conversation_id: UUID) -> bool:
         """Delete a conversation from the database.
         
@@ -3,6 +3,7 @@
 from typing import List, Optional
 from uuid import UUID
 
+from pgvector import HalfVector
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -94,11 +95,17 @@ class EmbeddingRepositoryImpl(EmbeddingRepository):
     @staticmethod
     def _to_domain(model: EmbeddingModel) -> Embedding:
         """Convert SQLAlchemy model to domain model."""
+        # Loaded rows hold a HalfVector; a just-flushed model still holds
+        # the array that was assigned to it
+        vector = model.embedding
+        if isinstance(vector, HalfVector):
+            vector = vector.to_numpy()
+        
         return Embedding(
             id=model.id,
             code_chunk_id=model.code_chunk_id,
             project_id=model.project_id,
-            embedding_vector=model.embedding,
+            embedding_vector=vector,
             model_name=model.model_name,
             created_at=model.created_at,
             metadata=model.extra_metadata,
@@ -48,7 +48,7 @@ class MessageRepositoryImpl(MessageRepository):
             role=message.role,
             content=message.content,
             created_at=message.created_at,
-            metadata=message.metadata,
+            metadata=message.metadata or {},
             parent_message_id=message.parent_message_id,
             feedback=message.feedback,
         )
@@ -130,7 +130,7 @@ class MessageRepositoryImpl(MessageRepository):
         
         # Update mutable fields
         message_model.feedback = message.feedback
-        message_model.metadata = message.metadata
+        message_model.metadata = message.metadata or {}
         
         await self.session.flush()
         return self._to_domain(message_model)
@@ -5,7 +5,7 @@ using Redis as the caching backend. It handles all caching operations including
 get, set, delete, and TTL management.
 """
 
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 import orjson
 import redis.asyncio as redis
@@ -96,6 +96,80 @@ class RedisCacheService(CacheService):
             logger.error("Cache set operation failed", key=key, error=str(e))
             return False
 
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Retrieve multiple values from cache with a single MGET.
+        
+        Missing keys and values that fail to deserialize are returned
+        as None; corrupted entries are deleted.
+        
+        Args:
+            keys: Cache keys to retrieve
+            
+        Returns:
+            List[Optional[Any]]: Cached values, in key order
+        """
+        if not keys:
+            return []
+        
+        try:
+            values = await self.redis_client.mget(keys)
+        except Exception as e:
+            logger.error("Cache mget operation failed", num_keys=len(keys), error=str(e))
+            return [None] * len(keys)
+        
+        results = []
+        corrupted = []
+        for key, value in zip(keys, values):
+            if value is None:
+                results.append(None)
+                continue
+            try:
+                results.append(orjson.loads(value))
+            except orjson.JSONDecodeError:
+                logger.warning("Failed to deserialize cached value", key=key)
+                corrupted.append(key)
+                results.append(None)
+        
+        if corrupted:
+            # Delete corrupted cache entries
+            await self.redis_client.delete(*corrupted)
+        
+        return results
+
+    async def mset(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set multiple values in cache in a single pipelined round-trip.
+        
+        Args:
+            items: Mapping of cache keys to values (must be JSON-serializable)
+            ttl: Optional time-to-live in seconds, applied to every key
+            
+        Returns:
+            bool: True if operation succeeded, False otherwise
+        """
+        if not items:
+            return True
+        
+        try:
+            # Serialize values to JSON
+            serialized = {key: orjson.dumps(value) for key, value in items.items()}
+            
+            if ttl is None:
+                await self.redis_client.mset(serialized)
+            else:
+                # MSET has no expiry, so pipeline SETEX commands instead
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for key, value in serialized.items():
+                        pipe.setex(key, ttl, value)
+                    await pipe.execute()
+            
+            return True
+        except TypeError as e:
+            logger.error("Value is not JSON-serializable", error=str(e))
+            return False
+        except Exception as e:
+            logger.error("Cache mset operation failed", num_keys=len(items), error=str(e))
+            return False
+
     async def delete(self, key: str) -> bool:
         """Delete value from cache.
         
@@ -44,6 +44,10 @@ async def lifespan(app: FastAPI):
         logger.error("Failed to initialize Redis", error=str(e))
         # Redis is optional for basic functionality
     
+    # Configure LangSmith tracing before the first request
+    from app.infrastructure.monitoring import get_langsmith_config
+    get_langsmith_config()
+    
     yield
     
     # Shutdown
@@ -56,6 +60,14 @@ async def lifespan(app: FastAPI):
         await close_redis_client()
     except Exception as e:
         logger.error("Error closing Redis", error=str(e))
+    
+    # Stop embedding batching, close pooled LLM provider connections, and
+    # drop the providers bound to them so a later startup does not reuse
+    # a closed client
+    from app.infrastructure.llm.http_pool import close_async_http_client
+    from app.infrastructure.llm.provider_factory import clear_providers
+    await clear_providers()
+    await close_async_http_client()
 
 
 # Create FastAPI application
@@ -5,12 +5,13 @@ from abuse and ensure fair usage across all users.
 """
 
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Dict, Tuple
 
 from fastapi import HTTPException, Request, status
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.domain.clock import utcnow
 from app.infrastructure.config.logger import get_logger
 from app.infrastructure.config.settings import settings
 
@@ -59,7 +60,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             HTTPException: If rate limit is exceeded
         """
         # Skip rate limiting for health check and docs
-        if request.url.path in ["/", "/health", "/api/v1/health", "/api/docs", "/api/redoc"]:
+        if request.url.path in {"/", "/health", "/api/v1/health", "/api/docs", "/api/redoc"}:
             return await call_next(request)
         
         # Get client IP
@@ -120,7 +121,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Raises:
             HTTPException: If rate limit is exceeded
         """
-        now = datetime.utcnow()
+        now = utcnow()
         counts = self.request_counts[client_ip]
         
         # Check minute limit
@@ -157,7 +158,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Args:
             client_ip: Client IP address
         """
-        now = datetime.utcnow()
+        now = utcnow()
         counts = self.request_counts[client_ip]
         counts["minute"].append(now)
         counts["hour"].append(now)
@@ -168,7 +169,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Args:
             client_ip: Client IP address
         """
-        now = datetime.utcnow()
+        now = utcnow()
         counts = self.request_counts[client_ip]
         
         # Keep only last minute for minute tracking
@@ -198,7 +199,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Returns:
             Tuple[int, int]: (remaining_minute, remaining_hour)
         """
-        now = datetime.utcnow()
+        now = utcnow()
         counts = self.request_counts[client_ip]
         
         minute_ago = now - timedelta(minutes=1)
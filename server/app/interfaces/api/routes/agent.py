@@ -41,14 +41,14 @@ async def submit_feedback(request: AgentFeedbackRequest):
         )
     
     try:
-        log_agent_feedback(
+        await log_agent_feedback(
             run_id=request.run_id,
             score=request.score,
             comment=request.comment,
         )
         
         logger.info(
-            "Agent feedback submitted",
+            "Agent feedback queued",
             run_id=request.run_id,
             score=request.score,
         )
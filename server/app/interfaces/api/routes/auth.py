@@ -4,10 +4,11 @@ This module provides authentication endpoints including user registration,
 login, token refresh, current user information retrieval, and password management.
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.application.ports.output.repository.user_repository import UserRepository
+from app.domain.clock import utcnow
 from app.domain.models.user import User
 from app.infrastructure.auth import jwt_handler, password_hasher
 from app.infrastructure.config.logger import get_logger
@@ -275,7 +276,7 @@ async def request_password_reset(
         user.id,
         additional_claims={
             "type": "password_reset",
-            "exp": datetime.utcnow() + timedelta(minutes=_PASSWORD_RESET_EXPIRE_MINUTES),
+            "exp": utcnow() + timedelta(minutes=_PASSWORD_RESET_EXPIRE_MINUTES),
         },
     )
     
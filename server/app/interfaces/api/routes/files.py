@@ -5,7 +5,6 @@ file upload, retrieval, deletion, processing, and semantic search.
 """
 
 import hashlib
-from datetime import datetime
 from typing import List
 from uuid import UUID
 
@@ -23,6 +22,7 @@ from app.application.ports.output.repository.project_repository import ProjectRe
 from app.application.ports.output.storage.file_storage_service import (
     FileStorageService,
 )
+from app.domain.clock import utcnow
 from app.domain.models.file import File
 from app.domain.models.user import User
 from app.domain.services.file_processing_service import FileProcessingService
@@ -96,7 +96,7 @@ async def upload_file(
         )
     
     # Validate file type
-    if request.file_type not in settings.allowed_extensions:
+    if request.file_type not in settings.allowed_extension_set:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File type '{request.file_type}' not allowed. Allowed types: {settings.allowed_extensions}",
@@ -131,7 +131,7 @@ async def upload_file(
         file_type=request.file_type,
         size_bytes=size_bytes,
         content_hash=content_hash,
-        last_modified=datetime.utcnow(),
+        last_modified=utcnow(),
     )
     
     created_file = await file_repo.create(file)
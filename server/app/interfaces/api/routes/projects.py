@@ -6,7 +6,6 @@ directory sync.
 """
 
 import hashlib
-from datetime import datetime
 from pathlib import Path
 from typing import List
 from uuid import UUID
@@ -16,6 +15,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from app.application.ports.output.repository.file_repository import FileRepository
 from app.application.ports.output.repository.project_repository import ProjectRepository
 from app.application.ports.output.storage.file_storage_service import FileStorageService
+from app.domain.clock import utcnow
 from app.domain.exceptions.project_exceptions import ProjectNotFoundException
 from app.domain.models.file import File
 from app.domain.models.project import Project
@@ -303,7 +303,7 @@ async def sync_project(
             detail=f"local_path '{project.local_path}' does not exist or is not a directory",
         )
 
-    allowed = set(settings.allowed_extensions)
+    allowed = settings.allowed_extension_set
     excluded_dirs = {
         "node_modules", ".git", ".venv", "venv", "__pycache__",
         ".pytest_cache", "dist", "build", ".next", "target",
@@ -352,7 +352,7 @@ async def sync_project(
             # Content changed: update metadata
             existing.content_hash = content_hash
             existing.size_bytes = size_bytes
-            existing.last_modified = datetime.utcnow()
+            existing.last_modified = utcnow()
             await file_repo.update(existing)
             await storage_service.save_file(
                 project_id=project_id,
@@ -369,7 +369,7 @@ async def sync_project(
                 file_type=file_type,
                 size_bytes=size_bytes,
                 content_hash=content_hash,
-                last_modified=datetime.utcnow(),
+                last_modified=utcnow(),
             )
             created = await file_repo.create(new_file)
             await storage_service.save_file(
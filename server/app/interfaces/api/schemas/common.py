@@ -10,6 +10,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.domain.clock import utcnow
+
 
 # Generic type variable for paginated responses
 T = TypeVar("T")
@@ -128,5 +130,5 @@ class HealthResponse(BaseModel):
     """Health check response model."""
     
     status: str = Field(..., description="Health status (healthy/unhealthy)")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Check timestamp")
+    timestamp: datetime = Field(default_factory=utcnow, description="Check timestamp")
     details: Optional[Dict[str, Any]] = Field(default=None, description="Additional health details")
@@ -6,9 +6,10 @@ and other streaming operations.
 """
 
 import asyncio
-import json
 from typing import Any, AsyncIterator, Dict
 
+import orjson
+
 from app.infrastructure.config.logger import get_logger
 
 logger = get_logger(__name__)
@@ -37,7 +38,7 @@ class SSEStreamHandler:
         Returns:
             str: Formatted SSE event string
         """
-        json_data = json.dumps(data)
+        json_data = orjson.dumps(data).decode("utf-8")
         return f"event: {event}\ndata: {json_data}\n\n"
 
     @staticmethod
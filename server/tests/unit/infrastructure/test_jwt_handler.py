@@ -0,0 +1,231 @@
+"""Tests for JWT signing and verification."""
+
+import base64
+import hashlib
+import hmac
+import time
+from datetime import timedelta
+from uuid import uuid4
+
+import orjson
+import pytest
+
+from app.domain.clock import utcnow
+from app.infrastructure.auth.jwt_handler import JWTError, JWTHandler
+
+SECRET = "test-secret"
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _forge(header: dict, payload: dict, secret: str = SECRET, digest=hashlib.sha256) -> str:
+    """Build a token by hand, signed with the given secret and digest."""
+    signing_input = f"{_b64(orjson.dumps(header))}.{_b64(orjson.dumps(payload))}"
+    signature = hmac.new(secret.encode(), signing_input.encode(), digest).digest()
+    return f"{signing_input}.{_b64(signature)}"
+
+
+@pytest.fixture
+def handler() -> JWTHandler:
+    return JWTHandler(secret_key=SECRET, algorithm="HS256")
+
+
+@pytest.mark.parametrize("algorithm", ["HS256", "HS384", "HS512"])
+def test_round_trip(algorithm):
+    handler = JWTHandler(secret_key=SECRET, algorithm=algorithm)
+    user_id = uuid4()
+    
+    access = handler.create_access_token(user_id)
+    refresh = handler.create_refresh_token(user_id)
+    
+    assert handler.verify_token(access) == user_id
+    assert handler.verify_token(refresh, token_type="refresh") == user_id
+    assert handler._decode(access)["type"] == "access"
+
+
+def test_token_interoperates_with_standard_hmac(handler):
+    user_id = uuid4()
+    token = _forge(
+        {"alg": "HS256", "typ": "JWT"},
+        {"sub": str(user_id), "exp": int(time.time()) + 60, "type": "access"},
+    )
+    
+    assert handler.verify_token(token) == user_id
+
+
+def test_wrong_token_type_is_rejected(handler):
+    token = handler.create_refresh_token(uuid4())
+    
+    assert handler.verify_token(token, token_type="access") is None
+
+
+def test_tampered_payload_is_rejected(handler):
+    token = handler.create_access_token(uuid4())
+    header, _, signature = token.split(".")
+    payload = _b64(orjson.dumps({"sub": str(uuid4()), "exp": int(time.time()) + 60, "type": "access"}))
+    
+    with pytest.raises(JWTError):
+        handler._decode(f"{header}.{payload}.{signature}")
+    assert handler.verify_token(f"{header}.{payload}.{signature}") is None
+
+
+def test_tampered_signature_is_rejected(handler):
+    token = handler.create_access_token(uuid4())
+    head, _, signature = token.rpartition(".")
+    flipped = "A" if signature[0] != "A" else "B"
+    
+    with pytest.raises(JWTError):
+        handler._decode(f"{head}.{flipped}{signature[1:]}")
+
+
+def test_token_signed_with_other_secret_is_rejected(handler):
+    token = _forge(
+        {"alg": "HS256", "typ": "JWT"},
+        {"sub": str(uuid4()), "exp": int(time.time()) + 60, "type": "access"},
+        secret="other-secret",
+    )
+    
+    assert handler.verify_token(token) is None
+
+
+@pytest.mark.parametrize("alg", ["none", "None", "HS512", "RS256", None])
+def test_algorithm_mismatch_is_rejected(handler, alg):
+    header = {"typ": "JWT"} if alg is None else {"alg": alg, "typ": "JWT"}
+    payload = {"sub": str(uuid4()), "exp": int(time.time()) + 60, "type": "access"}
+    
+    with pytest.raises(JWTError, match="algorithm"):
+        handler._decode(_forge(header, payload, digest=hashlib.sha512))
+
+
+def test_unsigned_none_token_is_rejected(handler):
+    payload = {"sub": str(uuid4()), "exp": int(time.time()) + 60, "type": "access"}
+    token = f"{_b64(orjson.dumps({'alg': 'none'}))}.{_b64(orjson.dumps(payload))}."
+    
+    assert handler.verify_token(token) is None
+
+
+def test_expired_token_is_rejected(handler):
+    token = _forge(
+        {"alg": "HS256", "typ": "JWT"},
+        {"sub": str(uuid4()), "exp": int(time.time()) - 1, "type": "access"},
+    )
+    
+    with pytest.raises(JWTError, match="expired"):
+        handler._decode(token)
+    assert handler.verify_token(token) is None
+
+
+def test_future_nbf_is_rejected(handler):
+    token = _forge(
+        {"alg": "HS256", "typ": "JWT"},
+        {
+            "sub": str(uuid4()),
+            "exp": int(time.time()) + 60,
+            "nbf": int(time.time()) + 30,
+            "type": "access",
+        },
+    )
+    
+    with pytest.raises(JWTError, match="not yet valid"):
+        handler._decode(token)
+
+
+@pytest.mark.parametrize("claim", ["exp", "nbf"])
+def test_non_numeric_time_claim_is_rejected(handler, claim):
+    payload = {"sub": str(uuid4()), "exp": int(time.time()) + 60, "type": "access"}
+    payload[claim] = "2999-01-01"
+    
+    with pytest.raises(JWTError):
+        handler._decode(_forge({"alg": "HS256", "typ": "JWT"}, payload))
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "",
+        "abc",
+        "abc.def",
+        "a.b.c",
+        "!!!.???.***",
+        "e30.W10.",  # payload is a JSON array
+        "W10.e30.",  # header is a JSON array
+    ],
+)
+def test_malformed_token_is_rejected(handler, token):
+    with pytest.raises(JWTError):
+        handler._decode(token)
+    assert handler.verify_token(token) is None
+    assert handler.decode_token(token) is None
+
+
+@pytest.mark.parametrize("segment", [0, 1, 2])
+@pytest.mark.parametrize("junk", ["!", "=", "+", "/", " ", "\n"])
+def test_token_with_inserted_characters_is_rejected(handler, segment, junk):
+    # urlsafe_b64decode() would skip these and still verify the signature
+    parts = handler.create_access_token(uuid4()).split(".")
+    parts[segment] = parts[segment][:4] + junk + parts[segment][4:]
+    token = ".".join(parts)
+    
+    with pytest.raises(JWTError, match="Malformed"):
+        handler._decode(token)
+    assert handler.verify_token(token) is None
+
+
+def test_non_canonical_trailing_bits_are_rejected(handler):
+    token = handler.create_access_token(uuid4())
+    head, _, signature = token.rpartition(".")
+    # A 32-byte HS256 signature ends in a character carrying 2 unused bits
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    last = alphabet[alphabet.index(signature[-1]) ^ 1]
+    
+    with pytest.raises(JWTError, match="Malformed"):
+        handler._decode(f"{head}.{signature[:-1]}{last}")
+
+
+def test_non_ascii_token_is_rejected(handler):
+    token = handler.create_access_token(uuid4())
+    
+    with pytest.raises(JWTError):
+        handler._decode(token + "é")
+    assert handler.verify_token("eyé.eyé.sig") is None
+
+
+def test_naive_datetime_exp_is_treated_as_utc(handler):
+    # The password reset route passes a naive UTC datetime as exp
+    user_id = uuid4()
+    expires = utcnow() + timedelta(minutes=15)
+    token = handler.create_access_token(
+        user_id,
+        additional_claims={"type": "password_reset", "exp": expires},
+    )
+    
+    exp = handler._decode(token)["exp"]
+    assert abs(exp - (time.time() + 15 * 60)) < 5
+    assert handler.verify_token(token, token_type="password_reset") == user_id
+
+
+def test_expired_naive_datetime_exp_is_rejected(handler):
+    token = handler.create_access_token(
+        uuid4(),
+        additional_claims={"type": "password_reset", "exp": utcnow() - timedelta(seconds=1)},
+    )
+    
+    assert handler.verify_token(token, token_type="password_reset") is None
+
+
+def test_cached_verification_respects_expiry(handler, monkeypatch):
+    user_id = uuid4()
+    token = handler.create_access_token(user_id)
+    assert handler.verify_token(token) == user_id
+    
+    # Past the token's exp the cache entry must not be trusted
+    real_time = time.time
+    monkeypatch.setattr(time, "time", lambda: real_time() + handler._access_expire_seconds + 1)
+    assert handler.verify_token(token) is None
+
+
+def test_unsupported_algorithm_is_refused():
+    with pytest.raises(ValueError):
+        JWTHandler(secret_key=SECRET, algorithm="RS256")